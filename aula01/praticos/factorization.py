@@ -0,0 +1,192 @@
+# Batch integer factorization built on the prime infrastructure of primos.py:
+# smallest-prime-factor table for small numbers, Pollard-Brent rho with the
+# Miller-Rabin is_prime for large ones, and a process pool for whole vectors.
+
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from primos import SMALL_PRIMES, SPF_LIMIT, get_spf_table, is_prime
+
+_spf_lookup = None
+
+def _get_spf_lookup() -> array:
+    """
+    The SPF table as an array('I'), indexing it returns plain Python ints.
+    """
+    global _spf_lookup
+
+    if _spf_lookup is None:
+        _spf_lookup = array('I', get_spf_table().tobytes())
+
+    return _spf_lookup
+
+def pollard_brent(number: int) -> int:
+    """
+    Returns a nontrivial factor of an odd composite number (Brent's variant of
+    Pollard's rho, with the gcd computed once per batch of steps).
+    """
+    if number % 2 == 0:
+        return 2
+
+    while True:
+        y = random.randrange(1, number)
+        c = random.randrange(1, number)
+        batch = 128
+        g = r = q = 1
+
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % number
+
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % number
+                    q = q * abs(x - y) % number
+                g = math.gcd(q, number)
+                k += batch
+            r *= 2
+
+        if g == number:
+            # The batch overshot: redo it one step at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % number
+                g = math.gcd(abs(x - saved), number)
+
+        # g == number means this (y, c) failed, try another one
+        if g != number:
+            return g
+
+def factorize(number: int) -> list:
+    """
+    Prime factors of number with multiplicity, in ascending order.
+    """
+    if number < 1:
+        raise ValueError("number must be positive")
+
+    factors = []
+
+    if number < SPF_LIMIT:
+        spf = _get_spf_lookup()
+        while number > 1:
+            p = spf[number]
+            factors.append(p)
+            number //= p
+        return factors
+
+    for p in SMALL_PRIMES:
+        while number % p == 0:
+            factors.append(p)
+            number //= p
+
+    pending = [number] if number > 1 else []
+    while pending:
+        value = pending.pop()
+
+        if value < SPF_LIMIT:
+            factors.extend(factorize(value))
+        elif is_prime(value):
+            factors.append(value)
+        else:
+            divisor = pollard_brent(value)
+            pending.append(divisor)
+            pending.append(value // divisor)
+
+    factors.sort()
+    return factors
+
+def _factorize_small_batch(values: np.ndarray) -> list:
+    """
+    Vectorized SPF factorization of many numbers below SPF_LIMIT at once:
+    one column of factors per round, until every number is reduced to 1.
+    """
+    spf = get_spf_table()
+    remaining = values.astype(np.uint32)
+    columns = []
+
+    while True:
+        active = remaining > 1
+        if not active.any():
+            break
+        p = np.where(active, spf[remaining], 0).astype(np.uint32)
+        columns.append(p)
+        remaining = np.where(active, remaining // np.maximum(p, 1), remaining)
+
+    if not columns:
+        return [[] for _ in range(len(values))]
+
+    rows = np.stack(columns, axis=1).tolist()
+    return [[p for p in row if p] for row in rows]
+
+def factorize_chunk(chunk) -> list:
+    """
+    Factors a chunk of numbers: small ones through the vectorized SPF path,
+    the others one by one with Pollard-Brent.
+    """
+    # tolist() gives Python ints; NumPy uint64 elements would break pow() in Miller-Rabin
+    values = chunk.tolist() if isinstance(chunk, np.ndarray) else [int(value) for value in chunk]
+    result = [None] * len(values)
+
+    small = [i for i, v in enumerate(values) if 1 <= v < SPF_LIMIT]
+    if small:
+        small_factors = _factorize_small_batch(np.array([values[i] for i in small], dtype=np.uint32))
+        for i, factors in zip(small, small_factors):
+            result[i] = factors
+
+    for i, value in enumerate(values):
+        if result[i] is None:
+            result[i] = factorize(value)
+
+    return result
+
+def factorize_vector(vector, workers: int = None, chunk_size: int = 10000) -> list:
+    """
+    Factor multisets of every number of a vector, chunks processed on a process pool.
+    The result keeps the order of the input.
+    """
+    values = vector.tolist() if isinstance(vector, np.ndarray) else list(vector)
+    chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        return [factors for chunk in chunks for factors in factorize_chunk(chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return [factors for result in executor.map(factorize_chunk, chunks) for factors in result]
+
+def _bench_factorize_vector(max_value: int):
+    """
+    Factory for bench.py: random vector of size n factored on the process pool.
+    """
+    def factory(n):
+        vector = [random.randint(1, max_value) for _ in range(n)]
+        return lambda: factorize_vector(vector)
+    return factory
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    "factorize_vector_small": (_bench_factorize_vector(SPF_LIMIT - 1), (10000, 100000)),
+    "factorize_vector_64bit": (_bench_factorize_vector(2**64 - 1), (1000, 10000)),
+}
+
+if __name__ == "__main__":
+    import time
+
+    for max_value in (10**6, 10**12, 2**64 - 1):
+        vector = [random.randint(1, max_value) for _ in range(10000)]
+
+        start = time.time()
+        factors = factorize_vector(vector)
+        end = time.time()
+        print(f"Factored 10000 numbers up to {max_value}: {vector[0]} = {factors[0]}, time: {end - start}")
+
+    # Chunks may also be NumPy arrays, e.g. straight from primos.iter_random_vector
+    chunk = np.array([2**61 - 1, 2**32 * 4294967291, 360], dtype=np.uint64)
+    assert factorize_chunk(chunk) == [[2**61 - 1], [2] * 32 + [4294967291], [2, 2, 2, 3, 3, 5]]
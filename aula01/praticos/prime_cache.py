@@ -0,0 +1,104 @@
+import pickle
+from collections import OrderedDict
+
+class PrimalityCache:
+    """
+    Shared cache of primality results.
+    Numbers below dense_limit live in two bitsets (known / prime), bigger numbers
+    in a bounded LRU dict. Hits and misses are counted for the hit rate.
+    """
+
+    def __init__(self, dense_limit: int = 1 << 24, max_entries: int = 1 << 16):
+        self.dense_limit = dense_limit
+        self.max_entries = max_entries
+        self._known = bytearray((dense_limit + 7) // 8)
+        self._prime = bytearray((dense_limit + 7) // 8)
+        self._lru = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, number: int):
+        """
+        Returns the cached result for number, or None if it is not cached.
+        """
+        if 0 <= number < self.dense_limit:
+            byte, bit = number >> 3, 1 << (number & 7)
+            if self._known[byte] & bit:
+                self.hits += 1
+                return bool(self._prime[byte] & bit)
+        else:
+            result = self._lru.get(number)
+            if result is not None:
+                self._lru.move_to_end(number)
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        return None
+
+    def put(self, number: int, result: bool):
+
+        if 0 <= number < self.dense_limit:
+            byte, bit = number >> 3, 1 << (number & 7)
+            self._known[byte] |= bit
+            if result:
+                self._prime[byte] |= bit
+            else:
+                self._prime[byte] &= ~bit & 0xFF
+            return
+
+        self._lru[number] = result
+        self._lru.move_to_end(number)
+        # Evict the least recently used entry
+        if len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def hit_rate(self) -> float:
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "sparse_entries": len(self._lru),
+        }
+
+    def clear(self):
+
+        self._known = bytearray(len(self._known))
+        self._prime = bytearray(len(self._prime))
+        self._lru.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path):
+        """
+        Writes the cache contents to disk so a warm cache survives restarts.
+        """
+        state = {
+            "dense_limit": self.dense_limit,
+            "max_entries": self.max_entries,
+            "known": bytes(self._known),
+            "prime": bytes(self._prime),
+            "sparse": list(self._lru.items()),
+        }
+        with open(path, "wb") as file:
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path) -> "PrimalityCache":
+        """
+        Builds a cache from a file written by save().
+        """
+        with open(path, "rb") as file:
+            state = pickle.load(file)
+
+        cache = cls(state["dense_limit"], state["max_entries"])
+        cache._known[:] = state["known"]
+        cache._prime[:] = state["prime"]
+        cache._lru.update(state["sparse"])
+        return cache
@@ -1,7 +1,163 @@
+import multiprocessing
+import operator
+import os
 import random
+import sys
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-def is_prime(number: int) -> bool:
+import numpy as np
+
+from prime_cache import PrimalityCache
+
+# Primes used for trial division before running Miller-Rabin
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# Bases that make Miller-Rabin deterministic for every n < 2**64
+MR_BASES_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Numbers below this limit are answered with a sieve lookup
+SIEVE_LIMIT = 1 << 20
+
+# Numbers below this limit are factored with the smallest-prime-factor table
+SPF_LIMIT = 1 << 20
+
+_sieve = None
+_spf_table = None
+
+# Cache shared by is_prime and is_prime_recursive
+primality_cache = PrimalityCache()
+
+def build_sieve(limit: int) -> bytearray:
+    """
+    Sieve of Eratosthenes. Returns a bytearray where sieve[n] == 1 iff n is prime.
+    """
+    sieve = bytearray([1]) * max(limit, 2)
+    sieve[0] = sieve[1] = 0
+
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit, i)))
+
+    return sieve
+
+def get_sieve() -> bytearray:
+    """
+    Returns the shared sieve, building it on first use.
+    """
+    global _sieve
+
+    if _sieve is None:
+        _sieve = build_sieve(SIEVE_LIMIT)
+
+    return _sieve
+
+def build_spf_table(limit: int) -> np.ndarray:
+    """
+    Smallest-prime-factor table built with the same sieve: spf[n] is the smallest
+    prime dividing n (spf[0] = spf[1] = 0).
+    """
+    spf = np.zeros(max(limit, 2), dtype=np.uint32)
+
+    for i in range(2, int(limit**0.5) + 1):
+        if spf[i] == 0:
+            multiples = spf[i*i::i]
+            multiples[multiples == 0] = i
+
+    # Whatever is still unmarked is prime
+    numbers = np.arange(len(spf), dtype=np.uint32)
+    unmarked = spf == 0
+    unmarked[:2] = False
+    spf[unmarked] = numbers[unmarked]
+
+    return spf
+
+def get_spf_table() -> np.ndarray:
+    """
+    Returns the shared smallest-prime-factor table, building it on first use.
+    """
+    global _spf_table
+
+    if _spf_table is None:
+        _spf_table = build_spf_table(SPF_LIMIT)
+
+    return _spf_table
+
+def set_primality_cache(cache: PrimalityCache):
+    """
+    Replaces the shared cache, e.g. with one loaded by PrimalityCache.load().
+    """
+    global primality_cache
+    primality_cache = cache
+
+def miller_rabin(number: int, bases) -> bool:
+    """
+    Miller-Rabin strong probable prime test of an odd number > 2 for the given bases.
+    """
+    # Write number - 1 as d * 2^s with d odd
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in bases:
+        base %= number
+        if base == 0:
+            continue
+
+        x = pow(base, d, number)
+        if x == 1 or x == number - 1:
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
+def is_prime(number: int, rounds: int = 16) -> bool:
+    """
+    Checks primality choosing the backend by size:
+    sieve lookup for small numbers, trial division by small primes followed by
+    deterministic Miller-Rabin below 2^64 and probabilistic rounds above that.
+    """
+    # NumPy integers (e.g. uint64 chunks) overflow or break pow(), so work on a Python int
+    number = operator.index(number)
+
+    if number < 2:
+        return False
+
+    if number < SIEVE_LIMIT:
+        return get_sieve()[number] == 1
+
+    cached = primality_cache.get(number)
+    if cached is not None:
+        return cached
+
+    result = _is_prime_large(number, rounds)
+    primality_cache.put(number, result)
+    return result
+
+def _is_prime_large(number: int, rounds: int) -> bool:
+
+    for p in SMALL_PRIMES:
+        if number % p == 0:
+            return False
+
+    if number < 1 << 64:
+        return miller_rabin(number, MR_BASES_64)
+
+    # Arbitrary-size input: deterministic bases plus random witnesses
+    bases = MR_BASES_64 + tuple(random.randrange(2, number - 1) for _ in range(rounds))
+    return miller_rabin(number, bases)
+
+def is_prime_trial_division(number: int) -> bool:
 
     i = 1
 
@@ -16,6 +172,23 @@ def is_prime(number: int) -> bool:
 
 def is_prime_recursive(number: int, divisor = 2) -> bool:
 
+    if number < 2:
+        return False
+
+    # Only the entry call goes through the cache
+    if divisor != 2:
+        return _is_prime_recursive(number, divisor)
+
+    cached = primality_cache.get(number)
+    if cached is not None:
+        return cached
+
+    result = _is_prime_recursive(number, divisor)
+    primality_cache.put(number, result)
+    return result
+
+def _is_prime_recursive(number: int, divisor = 2) -> bool:
+
     if number < 2:
         return False
     
@@ -25,21 +198,193 @@ def is_prime_recursive(number: int, divisor = 2) -> bool:
     if number%divisor == 0:
         return False
     
-    return is_prime_recursive(number, divisor+1)
+    return _is_prime_recursive(number, divisor+1)
 
 def get_random_vector(array_size: int, max_value: int) -> list:
     
     return [random.randint(1, max_value) for _ in range(array_size)]
 
-def get_biggest_prime(vector: list) -> int:
+def get_biggest_prime(vector: list, descending: bool = False) -> int:
+    """
+    Returns the biggest prime in the vector (0 if there is none).
+    With descending=True the distinct values are scanned from the largest down
+    and the scan stops at the first prime found.
+    NumPy arrays (e.g. chunks of iter_random_vector) are scanned as Python ints.
+    """
+    if isinstance(vector, np.ndarray):
+        vector = vector.tolist()
+
+    if descending:
+        for number in sorted(set(vector), reverse=True):
+            if is_prime(number):
+                return number
+        return 0
+
     biggest_prime = 0
 
     for number in vector:
-        if is_prime(number) and number > biggest_prime:
+        # Values not above the current best can't change the answer
+        if number > biggest_prime and is_prime(number):
             biggest_prime = number
 
     return biggest_prime
 
+def iter_random_vector(array_size: int, max_value: int, chunk_size: int = 1 << 20):
+    """
+    Generator version of get_random_vector, yields NumPy chunks of random values.
+    """
+    rng = np.random.default_rng()
+
+    for start in range(0, array_size, chunk_size):
+        size = min(chunk_size, array_size - start)
+        yield rng.integers(1, max_value, size=size, endpoint=True, dtype=np.uint64)
+
+def iter_vector_file(path, block_size: int = 1 << 24):
+    """
+    Streams whitespace separated integers from a text file as NumPy chunks.
+    """
+    with open(path, "rb") as file:
+        rest = b""
+
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+
+            block = rest + block
+            # Keep the last (possibly incomplete) token for the next block
+            cut = max(block.rfind(b" "), block.rfind(b"\n"))
+            if cut < 0:
+                rest = block
+                continue
+
+            rest = block[cut + 1:]
+            tokens = block[:cut].split()
+            if tokens:
+                yield np.array(tokens, dtype=np.uint64)
+
+        if rest.strip():
+            yield np.array(rest.split(), dtype=np.uint64)
+
+def _iter_chunks(source, chunk_size: int):
+    """
+    Normalizes the input of get_biggest_prime_parallel into NumPy chunks.
+    Accepts a file path, a NumPy array, a list or any iterable of ints or arrays.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        yield from iter_vector_file(source)
+        return
+
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size].astype(np.uint64, copy=False)
+        return
+
+    buffer = []
+    for item in source:
+        if isinstance(item, np.ndarray):
+            yield item.astype(np.uint64, copy=False)
+            continue
+
+        buffer.append(item)
+        if len(buffer) == chunk_size:
+            yield np.array(buffer, dtype=np.uint64)
+            buffer = []
+
+    if buffer:
+        yield np.array(buffer, dtype=np.uint64)
+
+def get_prime_candidates(source, chunk_size: int = 1 << 20) -> np.ndarray:
+    """
+    Deduplicates the input with np.unique and returns the values that survive
+    a vectorized small prime filter, sorted in descending order.
+    """
+    parts = []
+    pending = 0
+
+    for chunk in _iter_chunks(source, chunk_size):
+        parts.append(np.unique(chunk))
+        pending += len(parts[-1])
+
+        # Merge the partial results so memory follows the distinct values
+        if pending > 4 * chunk_size:
+            parts = [np.unique(np.concatenate(parts))]
+            pending = len(parts[0])
+
+    if not parts:
+        return np.empty(0, dtype=np.uint64)
+
+    candidates = np.unique(np.concatenate(parts))[::-1]
+
+    # Drop multiples of small primes (but keep the small primes themselves)
+    keep = candidates >= 2
+    for p in SMALL_PRIMES:
+        keep &= (candidates % np.uint64(p) != 0) | (candidates == np.uint64(p))
+
+    return candidates[keep]
+
+# Index of the first chunk (in descending order) known to contain a prime,
+# shared by every worker of get_biggest_prime_parallel
+_found_chunk = None
+
+def _init_prime_worker(found_chunk):
+    global _found_chunk
+    _found_chunk = found_chunk
+
+def _first_prime_in_chunk(index: int, chunk: np.ndarray) -> int:
+
+    for position, number in enumerate(chunk.tolist()):
+        # Stop when a chunk with bigger values already has a prime
+        if position % 64 == 0 and _found_chunk.value < index:
+            return 0
+
+        if is_prime(number):
+            with _found_chunk.get_lock():
+                if index < _found_chunk.value:
+                    _found_chunk.value = index
+            return number
+
+    return 0
+
+def get_biggest_prime_parallel(source, workers: int = None, chunk_size: int = 4096) -> int:
+    """
+    Returns the biggest prime of a vector, file or generator using a process pool.
+    The distinct candidates are checked in descending chunks and the remaining
+    workers are stopped as soon as the biggest prime is known.
+    """
+    candidates = get_prime_candidates(source)
+    if len(candidates) == 0:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    found_chunk = multiprocessing.Value("q", sys.maxsize)
+    chunks = (candidates[start:start + chunk_size]
+              for start in range(0, len(candidates), chunk_size))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_prime_worker,
+                             initargs=(found_chunk,)) as executor:
+        # Keep a bounded window of chunks in flight, consumed in order
+        in_flight = deque()
+        pending = enumerate(chunks)
+
+        while True:
+            while len(in_flight) < 2 * workers:
+                item = next(pending, None)
+                if item is None:
+                    break
+                in_flight.append(executor.submit(_first_prime_in_chunk, *item))
+
+            if not in_flight:
+                break
+
+            prime = in_flight.popleft().result()
+            if prime:
+                for future in in_flight:
+                    future.cancel()
+                return prime
+
+    return 0
+
 def get_biggest_prime_recursive(vector: list) -> int:
     biggest_prime = 0
 
@@ -48,6 +393,26 @@ def get_biggest_prime_recursive(vector: list) -> int:
             biggest_prime = number
     return biggest_prime
 
+def _bench_biggest_prime(function, max_value):
+    """
+    Factory for bench.py: random vector of size n, cache cleared before each run.
+    """
+    def factory(n):
+        vector = get_random_vector(n, max_value)
+        primality_cache.clear()
+        return lambda: function(vector)
+    return factory
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    "get_biggest_prime": (_bench_biggest_prime(get_biggest_prime, 100000), (10000, 100000)),
+    "get_biggest_prime_recursive": (_bench_biggest_prime(get_biggest_prime_recursive, 100000), (10000, 100000)),
+    "get_biggest_prime_64bit": (_bench_biggest_prime(get_biggest_prime, 2**64 - 1), (10000, 100000)),
+    "get_biggest_prime_descending_64bit": (
+        _bench_biggest_prime(lambda vector: get_biggest_prime(vector, descending=True), 2**64 - 1),
+        (10000, 100000)),
+}
+
 if __name__ == "__main__":
 
     # Get random vector
@@ -61,10 +426,39 @@ if __name__ == "__main__":
     end = time.time()
     print(f"Biggest prime number using iterative method: {biggest_prime}, time: {end - start}")
 
+    # Get start time
+    start = time.time()
+    # Get prime numbers scanning the distinct values in descending order
+    biggest_prime = get_biggest_prime(vector, descending=True)
+    # Get end time
+    end = time.time()
+    print(f"Biggest prime number using descending scan: {biggest_prime}, time: {end - start}")
+
+    # Get start time
+    start = time.time()
+    # Get prime numbers with the parallel pipeline
+    biggest_prime = get_biggest_prime_parallel(vector)
+    # Get end time
+    end = time.time()
+    print(f"Biggest prime number using parallel pipeline: {biggest_prime}, time: {end - start}")
+
     # Get start time
     start = time.time()
     # Get prime numbers with recursive method
     biggest_prime = get_biggest_prime_recursive(vector)
     # Get end time
     end = time.time()
-    print(f"Biggest prime number using recursive method: {biggest_prime}, time: {end - start}")
\ No newline at end of file
+    print(f"Biggest prime number using recursive method: {biggest_prime}, time: {end - start}")
+
+    # Second pass over the same vector is answered by the cache
+    start = time.time()
+    biggest_prime = get_biggest_prime_recursive(vector)
+    end = time.time()
+    print(f"Biggest prime number using recursive method (warm cache): {biggest_prime}, time: {end - start}")
+    print(f"Primality cache: {primality_cache.stats()}")
+
+    # uint64 chunks from iter_random_vector go straight into the pipeline
+    chunk = np.array([2**61 - 1, 2**62 - 1, 4294967291], dtype=np.uint64)
+    assert [is_prime(number) for number in chunk] == [True, False, True]
+    chunk = next(iter_random_vector(100, 10**9))
+    assert get_biggest_prime(chunk) == get_biggest_prime(chunk, descending=True) == get_biggest_prime_parallel(chunk, workers=2)
@@ -42,6 +42,13 @@ cab
 cba
 """
 
+#%%
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from math import factorial
+
 #%%
 def str_to_list(string):
     """
@@ -70,47 +77,232 @@ def bubble_sort(list):
 
 # %%
 bubble_sort(str_to_list("bacrtg"))
+# %%
+def next_permutation(chars):
+    """
+    Rearranges the list chars in place into the next permutation in ascending order.
+    Returns False (leaving chars untouched) when it is already the last one.
+    """
+    # 1. Find the largest index i such that chars[i] < chars[i+1]
+    i = len(chars) - 2
+    while i >= 0 and chars[i] >= chars[i+1]:
+        i -= 1
+
+    # If no such index exists, this is the last permutation
+    if i < 0:
+        return False
+
+    # 2. Find the largest index j > i such that chars[j] > chars[i]
+    j = len(chars) - 1
+    while chars[j] <= chars[i]:
+        j -= 1
+
+    # 3. Swap chars[i] and chars[j]
+    chars[i], chars[j] = chars[j], chars[i]
+
+    # 4. Reverse the suffix starting at chars[i+1] in place, without slice copies
+    left, right = i + 1, len(chars) - 1
+    while left < right:
+        chars[left], chars[right] = chars[right], chars[left]
+        left += 1
+        right -= 1
+
+    return True
+
+def count_permutations(string):
+    """
+    Number of distinct permutations of string (repeated characters count once).
+    """
+    total = factorial(len(string))
+    for count in Counter(string).values():
+        total //= factorial(count)
+    return total
+
+def rank(p):
+    """
+    Position of p in the ascending list of the distinct permutations of its characters.
+    """
+    counts = Counter(p)
+    remaining = len(p)
+    # Permutations of the characters not placed yet
+    total = count_permutations(p)
+    result = 0
+
+    for char in p:
+        # Every permutation starting with a smaller character comes before p
+        smaller = sum(count for c, count in counts.items() if c < char)
+        result += total * smaller // remaining
+
+        total = total * counts[char] // remaining
+        counts[char] -= 1
+        remaining -= 1
+
+    return result
+
+def unrank(string, k):
+    """
+    Returns the k-th (0-based) distinct permutation of string in ascending order.
+    """
+    total = count_permutations(string)
+    if not 0 <= k < total:
+        raise IndexError("permutation rank out of range")
+
+    counts = Counter(string)
+    alphabet = sorted(counts)
+    remaining = len(string)
+    result = []
+
+    for _ in range(len(string)):
+        for char in alphabet:
+            if counts[char] == 0:
+                continue
+
+            # Permutations that start with char at this position
+            block = total * counts[char] // remaining
+            if k < block:
+                result.append(char)
+                counts[char] -= 1
+                remaining -= 1
+                total = block
+                break
+            k -= block
+
+    return ''.join(result)
+
+def iter_permutations(string, start=0, stop=None):
+    """
+    Generator that yields the permutations of string lazily in ascending order.
+    start and stop are ranks, so the output can be resumed or split into shards.
+    """
+    total = count_permutations(string)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+
+    chars = str_to_list(unrank(string, start))
+
+    for _ in range(start, stop - 1):
+        yield ''.join(chars)
+        next_permutation(chars)
+    yield ''.join(chars)
+
 # %%
 def permutation(string):
     """
     This function takes a string and returns all the permutations of the string in ascending order.
     Uses a non-recursive approach based on lexicographic ordering.
+    Prefer iter_permutations for long strings, this keeps every permutation in memory.
     """
-    # Convert the string to a list of characters
-    chars = str_to_list(string)
-    
-    # Sort the list of characters to start with the first permutation
-    chars = bubble_sort(chars)
-    
-    # Initialize the result list with the first permutation
-    result = [''.join(chars)]
-    
-    while True:
-        # 1. Find the largest index i such that chars[i] < chars[i+1]
-        i = len(chars) - 2
-        while i >= 0 and chars[i] >= chars[i+1]:
-            i -= 1
-            
-        # If no such index exists, we've generated all permutations
-        if i < 0:
-            break
-            
-        # 2. Find the largest index j > i such that chars[j] > chars[i]
-        j = len(chars) - 1
-        while chars[j] <= chars[i]:
-            j -= 1
-            
-        # 3. Swap chars[i] and chars[j]
-        chars[i], chars[j] = chars[j], chars[i]
-        
-        # 4. Reverse the suffix starting at chars[i+1]
-        chars[i+1:] = chars[i+1:][::-1]
-        
-        # Add the new permutation to the result
-        result.append(''.join(chars))
-    
-    return result
+    return list(iter_permutations(string))
 
 # %%
 permutation("abc")
 # %%
+rank("bca"), unrank("abc", 3)
+# %%
+def read_batch(file):
+    """
+    Reads the batch input format described above: a count n followed by n strings.
+    """
+    tokens = file.read().split()
+    if not tokens:
+        return []
+    n = int(tokens[0])
+    return [token.decode() if isinstance(token, bytes) else token for token in tokens[1:n+1]]
+
+def permutation_shard(string, start, stop):
+    """
+    Renders the permutations with ranks in [start, stop) as newline terminated bytes.
+    """
+    return ('\n'.join(iter_permutations(string, start, stop)) + '\n').encode()
+
+def plan_shards(strings, shard_size):
+    """
+    Splits the permutation space of each string into rank ranges.
+    A None entry marks the blank line that follows each output set.
+    """
+    for string in strings:
+        total = count_permutations(string)
+        for start in range(0, total, shard_size):
+            yield (string, start, min(start + shard_size, total))
+        yield None
+
+def write_permutations(strings, output=None, workers=None, shard_size=200_000):
+    """
+    Writes all permutations of each string in ascending order, followed by a blank line.
+    Shards are rendered on a process pool and written in order with large buffered writes.
+    At most 2 * workers shards are in flight, so memory stays bounded on large batches.
+    """
+    output = output or sys.stdout.buffer
+    # Read twice (size check and shard plan), so a generator must not be consumed by the first
+    strings = list(strings)
+    shards = plan_shards(strings, shard_size)
+
+    # Less than one shard of work is not worth starting the pool
+    if workers == 1 or sum(count_permutations(string) for string in strings) <= shard_size:
+        for shard in shards:
+            output.write(permutation_shard(*shard) if shard is not None else b'\n')
+        output.flush()
+        return
+
+    workers = workers or os.cpu_count() or 1
+    window = deque()
+
+    def write_oldest():
+        # Oldest first keeps the output in ascending order
+        future = window.popleft()
+        output.write(future.result() if future is not None else b'\n')
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard in shards:
+            window.append(executor.submit(permutation_shard, *shard) if shard is not None else None)
+            if len(window) > 2 * workers:
+                write_oldest()
+        while window:
+            write_oldest()
+    output.flush()
+
+def _bench_permutation(n):
+    """
+    Factory for bench.py: all permutations of a string of length n, kept in a list.
+    """
+    string = "abcdefghijkl"[:n]
+    return lambda: permutation(string)
+
+def _bench_iter_permutations(n):
+    """
+    Factory for bench.py: the same permutations consumed lazily, nothing is kept.
+    """
+    string = "abcdefghijkl"[:n]
+
+    def run():
+        for _ in iter_permutations(string):
+            pass
+    return run
+
+# n is the string length (n! outputs), so bench.py skips sizes above max_size
+_bench_permutation.max_size = _bench_iter_permutations.max_size = 10
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    "permutation": (_bench_permutation, (6, 8, 9)),
+    "iter_permutations": (_bench_iter_permutations, (6, 8, 9)),
+}
+
+def main(argv=None):
+    """
+    Batch mode: python permutation.py [input_file] (reads stdin when omitted).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv:
+        with open(argv[0], 'rb') as file:
+            strings = read_batch(file)
+    else:
+        strings = read_batch(sys.stdin.buffer)
+
+    write_permutations(strings)
+
+if __name__ == "__main__":
+    main()
+# %%
@@ -0,0 +1,151 @@
+# Block-vectorized permutation generation: the same distinct permutations in
+# ascending order as permutation.py, but as uint8 NumPy matrices of symbol codes,
+# built by expanding all prefixes of a level at once instead of row by row.
+
+#%%
+from math import factorial
+
+import numpy as np
+
+from permutation import count_permutations
+
+#%%
+def multiset_codes(items):
+    """
+    Maps items (a string, a sequence or an int n meaning range(n)) to sorted symbol codes.
+    Returns (counts, alphabet): how many times each code appears and the symbol of each code.
+    """
+    if isinstance(items, int):
+        items = range(items)
+
+    alphabet = sorted(set(items))
+    if len(alphabet) > 256:
+        raise ValueError("at most 256 distinct symbols fit in uint8 codes")
+
+    index = {symbol: code for code, symbol in enumerate(alphabet)}
+    counts = np.zeros(len(alphabet), dtype=np.int64)
+    for item in items:
+        counts[index[item]] += 1
+
+    return counts, alphabet
+
+def expand_prefixes(prefixes, remaining, depth=1):
+    """
+    Appends every possible next symbol to each prefix, depth times.
+    prefixes is a (rows, length) uint8 matrix and remaining the (rows, symbols) counts
+    still available to each row. Children keep ascending order: np.nonzero walks the
+    mask row by row, and each row from the smallest symbol up.
+    """
+    for _ in range(depth):
+        rows, symbols = np.nonzero(remaining > 0)
+        codes = symbols.astype(np.uint8)
+
+        prefixes = np.hstack((prefixes[rows], codes[:, None]))
+        remaining = remaining[rows]
+        remaining[np.arange(len(rows)), symbols] -= 1
+
+    return prefixes, remaining
+
+def _multinomial(counts):
+    """
+    Number of distinct permutations of a multiset given by its symbol counts.
+    """
+    total = factorial(int(sum(counts)))
+    for count in counts:
+        total //= factorial(int(count))
+    return total
+
+def iter_permutation_blocks(items, block_size=65536):
+    """
+    Generator that yields the distinct permutations of items in ascending order
+    as uint8 matrices of block_size rows (the last one may be shorter).
+    Row values are codes into the alphabet returned by multiset_codes.
+    """
+    counts, _ = multiset_codes(items)
+    length = int(counts.sum())
+
+    prefixes = np.zeros((1, 0), dtype=np.uint8)
+    remaining = counts[None, :].copy()
+
+    # Fix a prefix deep enough that completing any one prefix fits in a block
+    depth = 0
+    while depth < length and max(_multinomial(row) for row in np.unique(remaining, axis=0)) > block_size:
+        prefixes, remaining = expand_prefixes(prefixes, remaining)
+        depth += 1
+
+    # The completions of a prefix only depend on the counts it has left, so they
+    # are built once per count signature and mapped onto the actual symbols
+    templates = {}
+    pending, pending_rows = [], 0
+
+    for prefix, left in zip(prefixes, remaining):
+        symbols = np.flatnonzero(left).astype(np.uint8)
+        signature = tuple(left[symbols])
+        if signature not in templates:
+            templates[signature] = permutation_matrix(np.repeat(np.arange(len(signature)), signature))
+
+        completion = symbols[templates[signature]]
+        rows = np.empty((len(completion), length), dtype=np.uint8)
+        rows[:, :depth] = prefix
+        rows[:, depth:] = completion
+
+        pending.append(rows)
+        pending_rows += len(rows)
+        if pending_rows < block_size:
+            continue
+
+        # Join the pieces once, then cut them into whole blocks
+        rows = np.concatenate(pending)
+        cut = len(rows) - len(rows) % block_size
+        for offset in range(0, cut, block_size):
+            yield rows[offset:offset + block_size]
+        pending, pending_rows = [rows[cut:]], len(rows) - cut
+
+    if pending_rows:
+        yield np.concatenate(pending)
+
+def permutation_matrix(items):
+    """
+    All distinct permutations of items in ascending order as one uint8 matrix.
+    """
+    counts, _ = multiset_codes(items)
+    length = int(counts.sum())
+    prefixes, _ = expand_prefixes(np.zeros((1, 0), dtype=np.uint8), counts[None, :].copy(), length)
+    return prefixes
+
+def decode_block(block, alphabet):
+    """
+    Turns a block of codes back into strings, e.g. to compare with permutation().
+    """
+    symbols = np.array([str(symbol) for symbol in alphabet])
+    return [''.join(row) for row in symbols[block]]
+
+# %%
+decode_block(permutation_matrix("aab"), multiset_codes("aab")[1])
+# %%
+def _bench_permutation_blocks(n):
+    """
+    Factory for bench.py: every permutation of n distinct indices, one block at a time.
+    """
+    def run():
+        for _ in iter_permutation_blocks(n):
+            pass
+    return run
+
+# n is the number of items (n! rows), so bench.py skips sizes above max_size
+_bench_permutation_blocks.max_size = 10
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    "permutation_blocks": (_bench_permutation_blocks, (6, 8, 9, 10)),
+}
+
+if __name__ == "__main__":
+    import time
+
+    for items in ("abc", "aabbc", 9, 10):
+        start = time.time()
+        rows = sum(len(block) for block in iter_permutation_blocks(items))
+        end = time.time()
+        expected = count_permutations(items if isinstance(items, str) else list(range(items)))
+        print(f"Permutations of {items}: {rows} (expected {expected}), time: {end - start}")
@@ -0,0 +1,208 @@
+# Implementação do HeapSort e de uma fila de prioridade d-ária
+# Autor: Matheus Cerqueira de Jesus
+# - heap_sort: ordena no lugar, construção de heap de Floyd (bottom-up) e
+#   descida "bounce" (desce até a folha pelo maior filho e depois sobe)
+# - DaryHeap: fila de prioridade (min-heap) d-ária, d = 2, 4 ou 8,
+#   com índice de posições para decrease_key
+
+def _sift_bounce(arr, root, end):
+    """
+    Reposiciona arr[root] no max-heap arr[:end].
+    Desce até uma folha sempre pelo maior filho (uma comparação por nível) e
+    depois sobe o elemento até sua posição, o que custa pouco porque o elemento
+    que vem do fim do vetor normalmente é pequeno.
+    """
+    item = arr[root]
+    pos = root
+    child = 2 * pos + 1
+    
+    # Desce abrindo espaço até a folha
+    while child < end:
+        right = child + 1
+        if right < end and arr[right] > arr[child]:
+            child = right
+        arr[pos] = arr[child]
+        pos = child
+        child = 2 * pos + 1
+    
+    # Sobe o elemento de volta
+    while pos > root:
+        parent = (pos - 1) // 2
+        if not item > arr[parent]:
+            break
+        arr[pos] = arr[parent]
+        pos = parent
+    
+    arr[pos] = item
+
+def heapify(arr):
+    """Construção de max-heap de Floyd, O(n)"""
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_bounce(arr, i, n)
+    return arr
+
+def heap_sort(arr):
+    """Ordena a lista no lugar (ordem crescente) e a retorna"""
+    heapify(arr)
+    
+    for end in range(len(arr) - 1, 0, -1):
+        # Move o maior para o fim e refaz o heap no prefixo restante
+        arr[0], arr[end] = arr[end], arr[0]
+        _sift_bounce(arr, 0, end)
+    
+    return arr
+
+class DaryHeap:
+    """
+    Fila de prioridade d-ária (min-heap) em vetor
+    - priorities[i] e items[i] formam a entrada i; os filhos de i são d*i+1 .. d*i+d
+    - position[item] guarda o índice de cada item, permitindo decrease_key em O(log_d n)
+    - Itens devem ser hasháveis e únicos
+    """
+    
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError("d deve ser pelo menos 2")
+        self.d = d
+        self.priorities = []
+        self.items = []
+        self.position = {}
+    
+    @classmethod
+    def from_array(cls, priorities, items=None, d=4):
+        """
+        Constrói o heap em O(n) a partir de um vetor (lista ou NumPy array) de prioridades.
+        Sem items, os itens são os índices 0..n-1.
+        """
+        heap = cls(d)
+        heap.priorities = priorities.tolist() if hasattr(priorities, "tolist") else list(priorities)
+        heap.items = list(range(len(heap.priorities))) if items is None else list(items)
+        heap.position = {item: i for i, item in enumerate(heap.items)}
+        
+        if len(heap.position) != len(heap.items):
+            raise ValueError("Itens devem ser únicos")
+        
+        for i in range((len(heap.items) - 2) // d, -1, -1):
+            heap._sift_down(i)
+        return heap
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __contains__(self, item):
+        return item in self.position
+    
+    def _move(self, index, priority, item):
+        """Grava a entrada na posição index e atualiza o índice de posições"""
+        self.priorities[index] = priority
+        self.items[index] = item
+        self.position[item] = index
+    
+    def _sift_up(self, index):
+        """Sobe a entrada enquanto for menor que o pai"""
+        priorities, items, d = self.priorities, self.items, self.d
+        priority, item = priorities[index], items[index]
+        
+        while index > 0:
+            parent = (index - 1) // d
+            if not priority < priorities[parent]:
+                break
+            self._move(index, priorities[parent], items[parent])
+            index = parent
+        
+        self._move(index, priority, item)
+    
+    def _sift_down(self, index):
+        """Desce a entrada trocando com o menor filho"""
+        priorities, items, d = self.priorities, self.items, self.d
+        n = len(items)
+        priority, item = priorities[index], items[index]
+        
+        while True:
+            first = d * index + 1
+            if first >= n:
+                break
+            
+            # Menor entre os até d filhos
+            last = min(first + d, n)
+            child = first
+            for c in range(first + 1, last):
+                if priorities[c] < priorities[child]:
+                    child = c
+            
+            if not priorities[child] < priority:
+                break
+            self._move(index, priorities[child], items[child])
+            index = child
+        
+        self._move(index, priority, item)
+    
+    def push(self, item, priority):
+        """Insere um item com a prioridade dada"""
+        if item in self.position:
+            raise KeyError(f"Item já está no heap: {item!r}")
+        self.priorities.append(priority)
+        self.items.append(item)
+        self.position[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+    
+    def peek(self):
+        """Retorna (item, prioridade) do menor sem remover"""
+        if not self.items:
+            raise IndexError("peek em heap vazio")
+        return self.items[0], self.priorities[0]
+    
+    def pop(self):
+        """Remove e retorna (item, prioridade) do menor"""
+        if not self.items:
+            raise IndexError("pop em heap vazio")
+        
+        top = self.items[0], self.priorities[0]
+        del self.position[top[0]]
+        
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        if self.items:
+            self._move(0, last_priority, last_item)
+            self._sift_down(0)
+        return top
+    
+    def pushpop(self, item, priority):
+        """Insere e remove o menor em uma única descida"""
+        if not self.items or not self.priorities[0] < priority:
+            return item, priority
+        if item in self.position:
+            raise KeyError(f"Item já está no heap: {item!r}")
+        
+        top = self.items[0], self.priorities[0]
+        del self.position[top[0]]
+        self._move(0, priority, item)
+        self._sift_down(0)
+        return top
+    
+    def decrease_key(self, item, priority):
+        """Diminui a prioridade de um item já presente"""
+        index = self.position[item]
+        if priority > self.priorities[index]:
+            raise ValueError("Nova prioridade maior que a atual")
+        self.priorities[index] = priority
+        self._sift_up(index)
+
+def main():
+    """Função de demonstração do HeapSort e da fila de prioridade"""
+    import random
+    
+    array = [random.randint(0, 100) for _ in range(15)]
+    print("Array:          ", array)
+    print("Array ordenado: ", heap_sort(array.copy()))
+    
+    for d in (2, 4, 8):
+        heap = DaryHeap(d)
+        for item, priority in enumerate(array):
+            heap.push(item, priority)
+        heap.decrease_key(len(array) - 1, -1)
+        print(f"Heap {d}-ário:    ", [heap.pop()[1] for _ in range(len(heap))])
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 # ShellSort, MergeSort, QuickSort e HeapSort.
 # Vou utilizar uma biblioteca que possui a implementação desses algoritmos.
 # Biblioteca Pysort: https://pypi.org/project/pysort/
+# O HeapSort usa a implementação própria de heap_sort.py (Floyd + descida bounce).
 
 from sorting_techniques.pysort import Sorting  # Import Sorting class diretamente
+from heap_sort import heap_sort
 import time
 import random
 
@@ -56,6 +58,57 @@ def partition(arr, left, right):
     arr[i+1], arr[right] = arr[right], arr[i+1]
     return i+1
 
+def _bench_sort(algorithm, generator):
+    """Factory para o bench.py: gera o array fora da medição"""
+    def factory(n):
+        array = generator(n)
+        return lambda: algorithm(array)
+    return factory
+
+def _bench_copy_and_sort(algorithm):
+    """Factory para o bench.py: uma iteração de mean_time (cópia + ordenação), retorna a cópia"""
+    def factory(n):
+        array = generate_random_array(n)
+        
+        def run():
+            array_copy = array.copy()
+            algorithm(array_copy)
+            return array_copy
+        return run
+    return factory
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    f"{name}/{kind}": (_bench_sort(algorithm, generator), (1000, 10000))
+    for name, algorithm in {
+        "ShellSort": lambda arr: Sorting().shellSort(arr),
+        "MergeSort": lambda arr: Sorting().mergeSort(arr),
+        "HeapSort": heap_sort,
+        "QuickSort": lambda arr: quickSort(arr, 0, len(arr) - 1),
+    }.items()
+    for kind, generator in {
+        "random": generate_random_array,
+        "sorted": generate_sorted_array,
+        "reversed": generate_reverse_sorted_array,
+    }.items()
+}
+BENCHMARKS.update({
+    f"{name}/copy_and_sort": (_bench_copy_and_sort(algorithm), (1000, 10000))
+    for name, algorithm in {
+        "ShellSort": lambda arr: Sorting().shellSort(arr),
+        "MergeSort": lambda arr: Sorting().mergeSort(arr),
+        "HeapSort": heap_sort,
+        "QuickSort": lambda arr: quickSort(arr, 0, len(arr) - 1),
+    }.items()
+})
+
+# Pivô no fim: com entrada ordenada ou invertida a recursão do quickSort tem
+# profundidade n e passa do limite do Python (~1000), então esses casos ficam pequenos
+for _kind in ("sorted", "reversed"):
+    _factory = BENCHMARKS[f"QuickSort/{_kind}"][0]
+    _factory.max_size = 900
+    BENCHMARKS[f"QuickSort/{_kind}"] = (_factory, (100, 900))
+
 def main():
     size = 100000
 
@@ -71,7 +124,7 @@ def main():
     algorithms = {
         "ShellSort": sorting_instance.shellSort,
         "MergeSort": sorting_instance.mergeSort,
-        "HeapSort": sorting_instance.heapSort,
+        "HeapSort": heap_sort,
         "QuickSort": lambda arr: quickSort(arr, 0, len(arr) - 1),
     }
 
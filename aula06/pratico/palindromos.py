@@ -1,6 +1,9 @@
 # Este codigo verifica se uma palavra é um palíndromo.
 # Esse codigo foi escrito com base no artigo do site https://www.geeksforgeeks.org/palindrome-string/
 
+import mmap
+import os
+import unicodedata
 
 def is_palimdrome(word):
     """
@@ -8,15 +11,20 @@ def is_palimdrome(word):
     """
     return word == word[::-1]
 
-def is_palimdrome_recursive(word):
+def is_palimdrome_recursive(word, first=0, last=None):
     """
     Check if a word is a palindrome using recursion.
+    Checks the pairs (i, n - 1 - i) for i in [first, last) by splitting the range
+    in halves, so the depth is about log2(n) and long words never reach the
+    recursion limit.
     """
-    if len(word) <= 1:
-        return True
-    if word[0] != word[-1]:
-        return False
-    return is_palimdrome_recursive(word[1:-1])
+    n = len(word)
+    if last is None:
+        last = n // 2
+    if last - first <= 1:
+        return first >= last or word[first] == word[n - 1 - first]
+    middle = (first + last) // 2
+    return is_palimdrome_recursive(word, first, middle) and is_palimdrome_recursive(word, middle, last)
 
 def is_palimdrome_iterative(word):
     """
@@ -27,9 +35,167 @@ def is_palimdrome_iterative(word):
             return False
     return True
 
+def manacher(text):
+    """
+    Manacher's algorithm, O(n).
+    Returns (odd, even): odd[i] is the number of odd palindromes centered at i and
+    even[i] the number of even palindromes whose right half starts at i.
+    Works for str and bytes.
+    """
+    n = len(text)
+
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and text[i - k] == text[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and text[i - k - 1] == text[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
+
+class PalindromeIndex:
+    """
+    Palindrome analytics over one text, built with Manacher's algorithm in O(n).
+    After the preprocessing, is_palindrome(i, j) answers for text[i:j] in O(1).
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.odd, self.even = manacher(text)
+
+    def is_palindrome(self, i, j):
+        """
+        Check if text[i:j] is a palindrome.
+        """
+        length = j - i
+        if length <= 1:
+            return True
+        if length % 2:
+            return self.odd[(i + j - 1) // 2] >= (length + 1) // 2
+        return self.even[(i + j) // 2] >= length // 2
+
+    def longest(self):
+        """
+        Returns the longest palindromic substring (the leftmost one on ties).
+        """
+        best_start, best_length = 0, 0
+
+        for i, k in enumerate(self.odd):
+            if 2 * k - 1 > best_length:
+                best_start, best_length = i - k + 1, 2 * k - 1
+        for i, k in enumerate(self.even):
+            if 2 * k > best_length or (2 * k == best_length and i - k < best_start):
+                best_start, best_length = i - k, 2 * k
+
+        return self.text[best_start:best_start + best_length]
+
+    def count(self):
+        """
+        Counts all palindromic substrings (by position, so repeated ones count again).
+        """
+        return sum(self.odd) + sum(self.even)
+
+def longest_palindromic_substring(text):
+    """
+    Returns the longest palindromic substring of text in O(n).
+    """
+    return PalindromeIndex(text).longest()
+
+def count_palindromic_substrings(text):
+    """
+    Counts the palindromic substrings of text in O(n).
+    """
+    odd, even = manacher(text)
+    return sum(odd) + sum(even)
+
+def is_palindrome_batch(words):
+    """
+    Check a batch of words at once, returns a list of booleans.
+    """
+    return [word == word[::-1] for word in words]
+
+def longest_palindromes_batch(words):
+    """
+    Longest palindromic substring of each word of a batch.
+    """
+    return [PalindromeIndex(word).longest() for word in words]
+
+def is_palindrome_buffer(buffer, block_size=1 << 16):
+    """
+    Check if a bytes-like object (bytes, bytearray, memoryview, mmap) is a palindrome.
+    Compares blocks from both ends through memoryviews, the data is never copied.
+    """
+    with memoryview(buffer) as view:
+        view = view.cast('B')
+        n = len(view)
+        half = n // 2
+
+        for start in range(0, half, block_size):
+            stop = min(start + block_size, half)
+            if view[start:stop] != view[n - stop:n - start][::-1]:
+                return False
+
+    return True
+
+def is_palindrome_file(path):
+    """
+    Check if the whole content of a file is a palindrome, reading it through mmap.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return is_palindrome_buffer(mapped)
+
+def iter_palindromes(lines, normalize=None, casefold=False, encoding='utf-8'):
+    """
+    Scans a word list line by line and yields the palindromes found.
+    lines can be a path, a file object or any iterable of str/bytes lines.
+    normalize is an optional Unicode normal form ('NFC', 'NFKC', ...) and
+    casefold ignores case differences. Byte lines are always decoded with encoding,
+    so multi-byte characters are compared as characters and not as raw bytes.
+    """
+    if isinstance(lines, (str, os.PathLike)):
+        with open(lines, 'rb') as file:
+            yield from iter_palindromes(file, normalize, casefold, encoding)
+        return
+
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode(encoding)
+        word = line.rstrip('\r\n')
+        if not word:
+            continue
+
+        key = unicodedata.normalize(normalize, word) if normalize else word
+        if casefold:
+            key = key.casefold()
+
+        if key == key[::-1]:
+            yield word
+
 if __name__ == "__main__":
 
     print(is_palimdrome("arara"))
     list = ["arara", "banana", "civic", "deified", "level", "madam", "racecar", "radar", "refer", "rotor", "sagas", "solos", "tenet", "wow"]
     for word in list:
-        print(f"{word} is a palindrome: {is_palimdrome(word)}")
\ No newline at end of file
+        print(f"{word} is a palindrome: {is_palimdrome(word)}")
+
+    text = "bananas e araras no radar"
+    index = PalindromeIndex(text)
+    print(f"Longest palindrome in '{text}': '{index.longest()}'")
+    print(f"Palindromic substrings in '{text}': {index.count()}")
+    print(f"'{text[1:6]}' is a palindrome: {index.is_palindrome(1, 6)}")
\ No newline at end of file
@@ -0,0 +1,198 @@
+# Indice de hashes polinomiais para consultas repetidas de palindromos e igualdade de substrings.
+# Baseado na tecnica de rolling hash (Rabin-Karp) com dois modulos: 2^64 e um primo de 32 bits.
+
+import random
+
+import numpy as np
+
+MASK = (1 << 64) - 1
+# Largest prime below 2^32: products of two residues still fit in uint64
+PRIME = 4294967291
+
+def _encode(text):
+    """
+    Converts str/bytes into an uint64 array of character codes (shifted by one so
+    that code 0 still changes the hash).
+    """
+    if isinstance(text, str):
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+    else:
+        codes = np.frombuffer(memoryview(text).cast('B'), dtype=np.uint8)
+    return codes.astype(np.uint64) + np.uint64(1)
+
+def _powers(base, n):
+    """
+    Returns [1, base, base^2, ..., base^n] modulo 2^64.
+    """
+    powers = np.empty(n + 1, dtype=np.uint64)
+    powers[0] = 1
+    powers[1:] = base
+    return np.cumprod(powers, dtype=np.uint64)
+
+def _prefix(codes, powers):
+    """
+    prefix[k] = sum(codes[t] * base^t for t < k) modulo 2^64.
+    """
+    prefix = np.zeros(len(codes) + 1, dtype=np.uint64)
+    np.cumsum(codes * powers[:len(codes)], dtype=np.uint64, out=prefix[1:])
+    return prefix
+
+def _powers_mod(base, n, modulus=PRIME):
+    """
+    Returns [1, base, ..., base^n] modulo a 32-bit prime, filled by doubling
+    (powers[k:2k] = powers[0:k] * base^k), so it stays vectorized.
+    """
+    powers = np.empty(n + 1, dtype=np.uint64)
+    powers[0] = 1
+    filled = 1
+    while filled < n + 1:
+        step = min(filled, n + 1 - filled)
+        powers[filled:filled + step] = powers[:step] * np.uint64(pow(base, filled, modulus)) % np.uint64(modulus)
+        filled += step
+    return powers
+
+def _prefix_mod(codes, powers, modulus=PRIME):
+    """
+    prefix[k] = sum(codes[t] * base^t for t < k) modulo a 32-bit prime.
+    Each term is below 2^32, so the plain uint64 cumsum cannot overflow before the final %.
+    """
+    prefix = np.zeros(len(codes) + 1, dtype=np.uint64)
+    terms = (codes % np.uint64(modulus)) * powers[:len(codes)] % np.uint64(modulus)
+    np.cumsum(terms, dtype=np.uint64, out=prefix[1:])
+    prefix %= np.uint64(modulus)
+    return prefix
+
+class RollingHashIndex:
+    """
+    Forward and reverse polynomial hash prefix arrays of a text (NumPy uint64).
+    Palindrome and substring equality queries are answered in O(1) and the
+    *_many methods vectorize over arrays of queries.
+
+    Every hash is a pair: one modulo 2^64 and one modulo a 32-bit prime, each with
+    its own base drawn at random per instance (seed makes them reproducible).
+    Modulo 2^64 alone collides for any base on Thue-Morse strings; the prime part
+    makes a false positive for two given unequal substrings of length L at most
+    about L / 2^32 over the choice of base. Answers are still probabilistic:
+    with verify=True every positive answer is confirmed by direct comparison.
+    """
+
+    def __init__(self, text, base=None, verify=False, seed=None):
+        rng = random.Random(seed)
+        # The 2^64 base must be odd so it has an inverse
+        base = rng.getrandbits(64) | 1 if base is None else base
+        base_mod = rng.randrange(256, PRIME - 1)
+
+        self.text = text
+        self.verify = verify
+        self.n = len(text)
+
+        codes = _encode(text)
+        powers = _powers(base, self.n)
+        self._forward = _prefix(codes, powers)
+        self._reverse = _prefix(codes[::-1], powers)
+        self._inverse_powers = _powers(pow(base, -1, 1 << 64), self.n)
+
+        powers = _powers_mod(base_mod, self.n)
+        self._forward_mod = _prefix_mod(codes, powers)
+        self._reverse_mod = _prefix_mod(codes[::-1], powers)
+        self._inverse_powers_mod = _powers_mod(pow(base_mod, -1, PRIME), self.n)
+
+    def _hash(self, forward, i, j):
+        """
+        Hash pair of the slice [i, j), normalized to start at base^0.
+        forward selects the forward prefix arrays, otherwise the reversed text.
+        """
+        prefix, prefix_mod = (self._forward, self._forward_mod) if forward else (self._reverse, self._reverse_mod)
+        return (((int(prefix[j]) - int(prefix[i])) * int(self._inverse_powers[i])) & MASK,
+                (int(prefix_mod[j]) - int(prefix_mod[i])) * int(self._inverse_powers_mod[i]) % PRIME)
+
+    def _equal_many(self, forward_a, i, j, forward_b, k, l):
+        """
+        Vectorized comparison of the hash pairs of [i, j) and [k, l).
+        """
+        def hashes(forward, start, stop):
+            prefix, prefix_mod = (self._forward, self._forward_mod) if forward else (self._reverse, self._reverse_mod)
+            # uint64 array arithmetic wraps around, i.e. it is already modulo 2^64
+            wide = (prefix[stop] - prefix[start]) * self._inverse_powers[start]
+            narrow = ((prefix_mod[stop] + np.uint64(PRIME) - prefix_mod[start]) % np.uint64(PRIME)
+                      * self._inverse_powers_mod[start] % np.uint64(PRIME))
+            return wide, narrow
+
+        wide_a, narrow_a = hashes(forward_a, i, j)
+        wide_b, narrow_b = hashes(forward_b, k, l)
+        return (wide_a == wide_b) & (narrow_a == narrow_b)
+
+    def substring_hash(self, i, j):
+        """
+        Hash of text[i:j], both parts packed in one int.
+        """
+        wide, narrow = self._hash(True, i, j)
+        return (wide << 32) | narrow
+
+    def is_palindrome(self, i, j):
+        """
+        Check if text[i:j] is a palindrome.
+        """
+        if j - i <= 1:
+            return True
+
+        # text[i:j] reversed is the slice [n-j, n-i) of the reversed text
+        result = self._hash(True, i, j) == self._hash(False, self.n - j, self.n - i)
+        if result and self.verify:
+            word = self.text[i:j]
+            return word == word[::-1]
+        return result
+
+    def substrings_equal(self, i, k, length):
+        """
+        Check if text[i:i+length] == text[k:k+length].
+        """
+        result = self._hash(True, i, i + length) == self._hash(True, k, k + length)
+        if result and self.verify:
+            return self.text[i:i + length] == self.text[k:k + length]
+        return result
+
+    def is_palindrome_many(self, i, j):
+        """
+        Vectorized is_palindrome over arrays of (i, j) pairs, returns a bool array.
+        """
+        i = np.asarray(i, dtype=np.int64)
+        j = np.asarray(j, dtype=np.int64)
+
+        result = self._equal_many(True, i, j, False, self.n - j, self.n - i)
+        result |= (j - i) <= 1
+
+        if self.verify:
+            for q in np.flatnonzero(result):
+                word = self.text[i[q]:j[q]]
+                result[q] = word == word[::-1]
+        return result
+
+    def substrings_equal_many(self, i, k, length):
+        """
+        Vectorized substrings_equal, length may be a scalar or an array.
+        """
+        i = np.asarray(i, dtype=np.int64)
+        k = np.asarray(k, dtype=np.int64)
+        length = np.broadcast_to(np.asarray(length, dtype=np.int64), i.shape)
+
+        result = self._equal_many(True, i, i + length, True, k, k + length)
+
+        if self.verify:
+            for q in np.flatnonzero(result):
+                result[q] = (self.text[i[q]:i[q] + length[q]] ==
+                             self.text[k[q]:k[q] + length[q]])
+        return result
+
+if __name__ == "__main__":
+
+    text = "bananas e araras no radar"
+    index = RollingHashIndex(text)
+    print(f"'{text[1:6]}' is a palindrome: {index.is_palindrome(1, 6)}")
+    print(f"'{text[0:6]}' is a palindrome: {index.is_palindrome(0, 6)}")
+    print(f"'{text[1:3]}' == '{text[3:5]}': {index.substrings_equal(1, 3, 2)}")
+
+    # Every substring of the text in a single vectorized call
+    i, j = np.triu_indices(len(text) + 1, k=1)
+    palindromes = index.is_palindrome_many(i, j)
+    print(f"Palindromic substrings: {int(palindromes.sum())}")
@@ -0,0 +1,180 @@
+# Python version of the alien RNA pairing problem solved in allien_rna/src/main.rs
+# Bases B-S and C-F are complementary. A base pairs with the previous unpaired base
+# when they are complementary and no connection crosses another, so a single stack
+# scan counts the maximal number of connections.
+
+import os
+
+import numpy as np
+
+BASES = b"BSCF"
+
+# 256-entry lookup table: COMPLEMENT[base] is the complementary base
+COMPLEMENT = bytes.maketrans(b"BSCF", b"SBFC")
+
+# Bytes ignored when reading sequences from files
+WHITESPACE = b" \t\r\n"
+
+def get_base_complement(base):
+    """
+    Returns the complement of a base (str or byte value).
+    """
+    if isinstance(base, str):
+        base = ord(base)
+    if base not in BASES:
+        raise ValueError("Invalid base")
+    return chr(COMPLEMENT[base])
+
+def _as_bytes(rnaa):
+
+    return rnaa.encode('ascii') if isinstance(rnaa, str) else rnaa
+
+def _validate(data):
+    """
+    Raises ValueError if data has anything other than B, S, C and F.
+    The check runs in C through bytes.translate.
+    """
+    if bytes(data).translate(None, BASES):
+        raise ValueError("Invalid base")
+
+class RNAPairingCounter:
+    """
+    Incremental version of calc_rnaa_connections.
+    The stack of unpaired bases is kept between feed() calls, so a sequence
+    can be processed in blocks without holding it all in memory.
+    """
+
+    def __init__(self):
+        self.stack = bytearray()
+        self.connections = 0
+
+    def feed(self, block):
+        """
+        Scans a block of bases (str, bytes or bytearray) and updates the count.
+        """
+        block = _as_bytes(block)
+        _validate(block)
+
+        stack = self.stack
+        complement = COMPLEMENT
+        connections = self.connections
+
+        for base in block:
+            if stack and stack[-1] == complement[base]:
+                stack.pop()
+                connections += 1
+            else:
+                stack.append(base)
+
+        self.connections = connections
+        return self
+
+def calc_rnaa_connections(rnaa):
+    """
+    Number of connections of an RNA sequence (str or bytes).
+    """
+    return RNAPairingCounter().feed(rnaa).connections
+
+def count_file_connections(path, block_size=1 << 20):
+    """
+    Connections of a single (possibly huge) sequence stored in a file, read in blocks.
+    """
+    counter = RNAPairingCounter()
+
+    with open(path, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            counter.feed(block.translate(None, WHITESPACE))
+
+    return counter.connections
+
+def iter_connections(source):
+    """
+    Batch mode: yields the connections of each sequence, one sequence per line.
+    source can be a path, a file object or any iterable of lines.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from iter_connections(file)
+        return
+
+    for line in source:
+        line = _as_bytes(line).translate(None, WHITESPACE)
+        if line:
+            yield calc_rnaa_connections(line)
+
+# NumPy encoding: B=0, S=1, C=2, F=3 (complement is code ^ 1), invalid bytes are 255
+_CODES = np.full(256, 255, dtype=np.uint8)
+_CODES[list(BASES)] = np.arange(4, dtype=np.uint8)
+
+def encode(rnaa):
+    """
+    Vectorized encoding of a sequence into an uint8 array of base codes.
+    """
+    codes = _CODES[np.frombuffer(_as_bytes(rnaa), dtype=np.uint8)]
+    if (codes == 255).any():
+        raise ValueError("Invalid base")
+    return codes
+
+def calc_encoded_connections(codes):
+    """
+    Connections of a sequence already encoded by encode(), with no per-base Python loop.
+    The stack scan computes the free reduction of the sequence (adjacent B/S and
+    C/F cancel), which does not depend on the order of the cancellations, so
+    neighbouring blocks are reduced and merged in pairs: log2(n) rounds of
+    whole-array operations. A merge drops the longest suffix of the left block
+    that cancels with the prefix of the right one.
+    """
+    codes = np.asarray(codes, dtype=np.uint8)
+    n = codes.size
+    if n < 2:
+        return 0
+
+    blocks = codes.reshape(n, 1)
+    lengths = np.ones(n, dtype=np.int32)
+
+    while len(blocks) > 1:
+        if len(blocks) % 2:
+            blocks = np.vstack((blocks, np.zeros((1, blocks.shape[1]), dtype=np.uint8)))
+            lengths = np.append(lengths, np.int32(0))
+
+        left, right = blocks[0::2], blocks[1::2]
+        left_len, right_len = lengths[0::2, None], lengths[1::2, None]
+        rows = np.arange(len(left), dtype=np.int32)[:, None]
+        columns = np.arange(blocks.shape[1], dtype=np.int32)
+
+        # left read backwards from its last base against the complement of right
+        back = left_len - 1 - columns
+        cancels = left[rows, np.maximum(back, 0)] == right ^ 1
+        cancels &= (back >= 0) & (columns < right_len)
+        cut = np.where(cancels.all(axis=1), blocks.shape[1], np.argmin(cancels, axis=1))[:, None]
+
+        merged_len = left_len + right_len - 2 * cut
+        merged = np.zeros((len(left), max(int(merged_len.max()), 1)), dtype=np.uint8)
+        width = min(merged.shape[1], blocks.shape[1])
+        merged[:, :width] = left[:, :width]
+
+        # right[cut:] goes right after what is left of the left block
+        keep = (columns >= cut) & (columns < right_len)
+        target = left_len - 2 * cut + columns
+        merged[np.broadcast_to(rows, keep.shape)[keep], target[keep]] = right[keep]
+
+        blocks, lengths = merged, merged_len[:, 0]
+
+    # Every connection removes two bases from the reduced sequence
+    return (n - int(lengths[0])) // 2
+
+if __name__ == "__main__":
+
+    rnaa = "BSCFSCB"
+    connections = calc_rnaa_connections(rnaa)
+    print(f"Number of connections: {connections}")
+
+    # Test cases (same as the Rust version)
+    assert calc_rnaa_connections("BSCFSCB") == 2
+    assert calc_rnaa_connections("BSCF") == 2
+    assert calc_rnaa_connections("BS") == 1
+    assert calc_rnaa_connections("BCF") == 1
+    assert calc_encoded_connections(encode("BSCFSCB")) == 2
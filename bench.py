@@ -0,0 +1,398 @@
+# Unified benchmark runner for every algorithm module of the repository.
+#
+# A module registers benchmarks with a module-level dict:
+#
+#     BENCHMARKS = {
+#         "name": (factory, default_sizes),
+#     }
+#
+# factory(n) prepares the input of size n (not timed) and returns a zero-argument
+# callable, which is the timed part. The factory is called again before every
+# repeat, so benchmarks that sort or mutate their input always start fresh.
+# If the callable has a `counters` attribute (a function returning a dict), the
+# counters of the last repeat are added to the JSON report.
+# If the factory has a `max_size` attribute, bigger sizes (e.g. from --sizes) are
+# skipped. Benchmarks whose n is not a data size, like the length of a string
+# whose n! permutations are generated, use it to stay runnable.
+#
+# Usage:
+#     python bench.py --list
+#     python bench.py -k seminario02 --repeats 5 --json results.json
+#     python bench.py --baseline results.json --fail-on-regression
+#     python bench.py --memory -k seminario02 --sizes 1000 10000 100000
+#
+# In --memory mode each benchmark runs once under tracemalloc and the report has
+# the peak and retained memory of the timed callable plus a deep sys.getsizeof
+# walk of the object it returns, divided by the number of elements.
+
+import argparse
+import csv
+import fnmatch
+import gc
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "target"}
+
+def discover(root=ROOT):
+    """
+    Imports every module under root that defines BENCHMARKS.
+    Returns ({"dir/module:name": (factory, sizes)}, {module path: import error}).
+    """
+    benchmarks = {}
+    errors = {}
+
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if d not in SKIP_DIRS and not d.startswith("."))
+
+        for filename in sorted(files):
+            path = os.path.join(directory, filename)
+            if not filename.endswith(".py") or path == os.path.abspath(__file__):
+                continue
+
+            # Cheap text check before paying for the import
+            with open(path, encoding="utf-8", errors="ignore") as file:
+                if "BENCHMARKS" not in file.read():
+                    continue
+
+            relative = os.path.relpath(path, root)[:-3].replace(os.sep, "/")
+            try:
+                module = _import_path(path, relative)
+            except Exception as error:
+                errors[relative] = f"{type(error).__name__}: {error}"
+                continue
+
+            for name, entry in getattr(module, "BENCHMARKS", {}).items():
+                benchmarks[f"{relative}:{name}"] = entry
+
+    return benchmarks, errors
+
+def _import_path(path, relative):
+    """
+    Imports a module from its path. Its directory goes into sys.path so the
+    sibling imports used across the repository (from treap import Treap) work.
+    """
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    module_name = "bench_" + relative.replace("/", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def pin_cpu(cpu):
+    """
+    Pins the process to one CPU when the platform supports it.
+    """
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, {cpu})
+    return True
+
+def run_benchmark(factory, size, repeats=5, warmup=1, disable_gc=True):
+    """
+    Times factory(size)() repeats times after warmup untimed runs.
+    Returns (list of timings in seconds, counters of the last repeat or None).
+    """
+    for _ in range(warmup):
+        factory(size)()
+
+    timings = []
+    counters = None
+    gc_was_enabled = gc.isenabled()
+
+    try:
+        for _ in range(repeats):
+            run = factory(size)
+            gc.collect()
+            if disable_gc:
+                gc.disable()
+
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+
+            if gc_was_enabled:
+                gc.enable()
+            if hasattr(run, "counters"):
+                counters = run.counters()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return timings, counters
+
+# Objects counted by deep_sizeof but not walked into (shared, not owned by the structure)
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                 types.MethodType, types.CodeType)
+
+def deep_sizeof(obj):
+    """
+    sys.getsizeof of obj plus everything reachable from it (containers,
+    instance __dict__ and __slots__), counting each object once.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, _SHARED_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        # __slots__ only lists the class's own slots; inherited ones live on the bases
+        for cls in type(current).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+
+    return total
+
+def measure_memory(factory, size):
+    """
+    Runs factory(size)() once under tracemalloc (the setup is not traced).
+    Returns peak and retained traced bytes and the deep size of the result.
+    """
+    run = factory(size)
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        result = run()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    deep = deep_sizeof(result) if result is not None else 0
+    # Containers report their own length, anything else counts as size elements
+    elements = len(result) if isinstance(result, (list, tuple, dict, set)) else size
+
+    return {
+        "peak": peak,
+        "retained": retained,
+        "deep_size": deep,
+        "elements": elements,
+        "bytes_per_element": deep / elements if elements else 0.0,
+    }
+
+def summarize(name, size, timings, counters=None):
+
+    row = {
+        "name": name,
+        "size": size,
+        "repeats": len(timings),
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+    if counters is not None:
+        row["counters"] = counters
+    return row
+
+def load_baseline(path):
+    """
+    Reads a JSON file written with --json, keyed by (name, size).
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {(row["name"], row["size"]): row for row in data["results"]}
+
+def compare(results, baseline, threshold, metric="median"):
+    """
+    Adds the ratio of metric against the baseline to every result.
+    Returns the results worse than the baseline by more than threshold.
+    """
+    regressions = []
+
+    for row in results:
+        reference = baseline.get((row["name"], row["size"]))
+        if reference is None or not reference.get(metric):
+            row["ratio"] = None
+            continue
+
+        row["ratio"] = row[metric] / reference[metric]
+        if row["ratio"] > 1 + threshold:
+            regressions.append(row)
+
+    return regressions
+
+def print_table(results, file=sys.stdout):
+
+    with_ratio = any("ratio" in row for row in results)
+    width = max([len("Benchmark")] + [len(row["name"]) for row in results])
+
+    header = f"{'Benchmark':<{width}} {'n':>10} {'min (s)':>12} {'median (s)':>12} {'stdev (s)':>12}"
+    if with_ratio:
+        header += f" {'vs base':>9}"
+    print(header, file=file)
+    print("-" * len(header), file=file)
+
+    for row in results:
+        line = (f"{row['name']:<{width}} {row['size']:>10} {row['min']:>12.6f} "
+                f"{row['median']:>12.6f} {row['stdev']:>12.6f}")
+        if with_ratio:
+            ratio = row.get("ratio")
+            line += f" {ratio:>8.2f}x" if ratio is not None else f" {'-':>9}"
+        print(line, file=file)
+
+def print_memory_table(results, file=sys.stdout):
+
+    with_ratio = any("ratio" in row for row in results)
+    width = max([len("Benchmark")] + [len(row["name"]) for row in results])
+
+    header = (f"{'Benchmark':<{width}} {'n':>10} {'peak (KiB)':>12} {'retained (KiB)':>15} "
+              f"{'deep (KiB)':>12} {'elements':>10} {'B/elem':>10}")
+    if with_ratio:
+        header += f" {'vs base':>9}"
+    print(header, file=file)
+    print("-" * len(header), file=file)
+
+    for row in results:
+        line = (f"{row['name']:<{width}} {row['size']:>10} {row['peak'] / 1024:>12.1f} "
+                f"{row['retained'] / 1024:>15.1f} {row['deep_size'] / 1024:>12.1f} "
+                f"{row['elements']:>10} {row['bytes_per_element']:>10.1f}")
+        if with_ratio:
+            ratio = row.get("ratio")
+            line += f" {ratio:>8.2f}x" if ratio is not None else f" {'-':>9}"
+        print(line, file=file)
+
+def write_json(results, path, settings):
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"settings": settings, "results": results}, file, indent=2)
+
+def write_csv(results, path, memory=False):
+
+    if memory:
+        fields = ["name", "size", "peak", "retained", "deep_size", "elements",
+                  "bytes_per_element", "ratio"]
+    else:
+        fields = ["name", "size", "repeats", "min", "median", "mean", "stdev", "ratio"]
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+def parse_args(argv=None):
+
+    parser = argparse.ArgumentParser(description="Runs the registered benchmarks of the repository")
+    parser.add_argument("-k", "--filter", default="*",
+                        help="glob or substring selecting benchmark names")
+    parser.add_argument("--list", action="store_true", help="only list the benchmarks found")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="input sizes (default: the sizes registered by each benchmark)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--cpu", type=int, help="pin the process to this CPU")
+    parser.add_argument("--keep-gc", action="store_true",
+                        help="leave the garbage collector on while timing")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure memory (tracemalloc + deep sizeof) instead of time")
+    parser.add_argument("--json", help="write the results to a JSON file")
+    parser.add_argument("--csv", help="write the results to a CSV file")
+    parser.add_argument("--baseline", help="JSON file from a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown counted as a regression (default 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    return parser.parse_args(argv)
+
+def _selected(name, pattern):
+
+    return fnmatch.fnmatch(name, pattern) or pattern in name
+
+def main(argv=None):
+
+    args = parse_args(argv)
+    benchmarks, errors = discover()
+
+    for module, error in errors.items():
+        print(f"Skipping {module}: {error}", file=sys.stderr)
+
+    selected = {name: entry for name, entry in sorted(benchmarks.items())
+                if _selected(name, args.filter)}
+
+    if args.list:
+        for name, (factory, sizes) in selected.items():
+            max_size = getattr(factory, "max_size", None)
+            print(f"{name}  sizes={list(sizes)}" + (f"  max_size={max_size}" if max_size is not None else ""))
+        return 0
+
+    pinned = pin_cpu(args.cpu)
+    results = []
+
+    for name, (factory, sizes) in selected.items():
+        max_size = getattr(factory, "max_size", None)
+        for size in args.sizes or sizes:
+            if max_size is not None and size > max_size:
+                print(f"  {name} n={size}: skipped (max_size={max_size})", file=sys.stderr)
+                continue
+            if args.memory:
+                results.append({"name": name, "size": size, **measure_memory(factory, size)})
+                print(f"  {name} n={size}: peak {results[-1]['peak'] / 1024:.1f} KiB",
+                      file=sys.stderr)
+                continue
+
+            timings, counters = run_benchmark(factory, size, args.repeats, args.warmup,
+                                              not args.keep_gc)
+            results.append(summarize(name, size, timings, counters))
+            print(f"  {name} n={size}: {results[-1]['median']:.6f} s", file=sys.stderr)
+
+    regressions = []
+    if args.baseline:
+        metric = "peak" if args.memory else "median"
+        regressions = compare(results, load_baseline(args.baseline), args.threshold, metric)
+
+    print()
+    if args.memory:
+        print_memory_table(results)
+    else:
+        print_table(results)
+
+    settings = {
+        "mode": "memory" if args.memory else "time",
+        "repeats": args.repeats,
+        "warmup": args.warmup,
+        "cpu": args.cpu if pinned else None,
+        "gc_disabled": not args.keep_gc,
+        "python": sys.version.split()[0],
+    }
+    if args.json:
+        write_json(results, args.json, settings)
+    if args.csv:
+        write_csv(results, args.csv, args.memory)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for row in regressions:
+            print(f"  {row['name']} n={row['size']}: {row['ratio']:.2f}x")
+        if args.fail_on_regression:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -197,6 +197,19 @@ def plot_results(sizes, sequential_times, parallel_times, cuda_times):
     plt.savefig('odd_even_sort_comparison.png')
     plt.show()
 
+def _bench_sort(sort_function):
+    """Factory for bench.py: the random array is generated outside the timing."""
+    def factory(n):
+        array = generate_random_array(n)
+        return lambda: sort_function(array)
+    return factory
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    "odd_even_sort_sequential": (_bench_sort(odd_even_sort_sequential), (100, 1000)),
+    "odd_even_sort_parallel": (_bench_sort(odd_even_sort_parallel), (100, 1000)),
+}
+
 if __name__ == "__main__":
     # Test with different array sizes
     sizes = [100, 500, 1000, 5000, 10000]
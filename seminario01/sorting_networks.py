@@ -0,0 +1,236 @@
+# Batched sorting networks: sort every row of a 2-D NumPy array at once.
+# A sorting network is a fixed schedule of compare-exchange steps, so the same
+# schedule sorts all rows; each comparator (i, j) becomes one np.minimum and one
+# np.maximum over whole columns. Odd-even transposition sort is one such network.
+import random
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# Optimal-size networks for small widths, as layers of independent comparators
+OPTIMAL_NETWORKS = {
+    2: (((0, 1),),),
+    3: (((0, 2),), ((0, 1),), ((1, 2),)),
+    4: (((0, 2), (1, 3)), ((0, 1), (2, 3)), ((1, 2),)),
+    5: (((0, 3), (1, 4)), ((0, 2), (1, 3)), ((0, 1), (2, 4)), ((1, 2), (3, 4)), ((2, 3),)),
+    6: (((0, 5), (1, 3), (2, 4)), ((1, 2), (3, 4)), ((0, 3), (2, 5)), ((0, 1), (2, 3), (4, 5)),
+        ((1, 2), (3, 4))),
+    7: (((0, 6), (2, 3), (4, 5)), ((0, 2), (1, 4), (3, 6)), ((0, 1), (2, 5), (3, 4)), ((1, 2), (4, 6)),
+        ((2, 3), (4, 5)), ((1, 2), (3, 4), (5, 6))),
+    8: (((0, 2), (1, 3), (4, 6), (5, 7)), ((0, 4), (1, 5), (2, 6), (3, 7)),
+        ((0, 1), (2, 3), (4, 5), (6, 7)), ((2, 4), (3, 5)), ((1, 4), (3, 6)), ((1, 2), (3, 4), (5, 6))),
+}
+
+NETWORK_KINDS = ("auto", "optimal", "odd_even_merge", "bitonic", "odd_even_transposition")
+
+def _next_power_of_two(n):
+    return 1 << max(0, n - 1).bit_length()
+
+def _prune(layers, n):
+    """
+    Drops comparators that touch positions >= n. Every comparator sends the minimum
+    to the lower index, so padding the input with +inf values that never move makes
+    a power-of-two network valid for any width.
+    """
+    pruned = []
+    for layer in layers:
+        kept = tuple((i, j) for i, j in layer if j < n)
+        if kept:
+            pruned.append(kept)
+    return tuple(pruned)
+
+def odd_even_merge_network(n):
+    """Batcher's odd-even merge sort network for n inputs."""
+    size = _next_power_of_two(n)
+    layers = []
+
+    p = 1
+    while p < size:
+        k = p
+        while k >= 1:
+            layer = []
+            for j in range(k % p, size - k, 2 * k):
+                for i in range(min(k, size - j - k)):
+                    # Only compare elements that belong to the same merge of 2p
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                        layer.append((i + j, i + j + k))
+            layers.append(tuple(layer))
+            k //= 2
+        p *= 2
+
+    return _prune(layers, n)
+
+def bitonic_network(n):
+    """Batcher's bitonic sort network for n inputs, with every comparator ascending."""
+    size = _next_power_of_two(n)
+    layers = []
+
+    block = 2
+    while block <= size:
+        # First step of each merge compares mirrored positions, so no descending halves are needed
+        layers.append(tuple((start + i, start + block - 1 - i)
+                            for start in range(0, size, block) for i in range(block // 2)))
+        half = block // 4
+        while half >= 1:
+            layers.append(tuple((start + i, start + i + half)
+                                for start in range(0, size, 2 * half) for i in range(half)))
+            half //= 2
+        block *= 2
+
+    return _prune(layers, n)
+
+def odd_even_transposition_network(n):
+    """Odd-even transposition sort as a network: n alternating layers of neighbour comparators."""
+    return tuple(tuple((i, i + 1) for i in range(step % 2, n - 1, 2))
+                 for step in range(n) if n > step % 2 + 1)
+
+@lru_cache(maxsize=None)
+def network(n, kind="auto"):
+    """
+    Comparator schedule (tuple of layers) for width n.
+    "auto" uses the optimal network when one is known and odd-even merge otherwise.
+    """
+    if kind not in NETWORK_KINDS:
+        raise ValueError(f"Unknown network kind: {kind}")
+
+    if kind == "auto":
+        kind = "optimal" if n in OPTIMAL_NETWORKS else "odd_even_merge"
+
+    if kind == "optimal":
+        if n < 2:
+            return ()
+        if n not in OPTIMAL_NETWORKS:
+            raise ValueError(f"No optimal network stored for width {n}")
+        return OPTIMAL_NETWORKS[n]
+    if kind == "odd_even_merge":
+        return odd_even_merge_network(n)
+    if kind == "bitonic":
+        return bitonic_network(n)
+    return odd_even_transposition_network(n)
+
+def comparator_count(layers):
+    """Number of compare-exchange steps in a network."""
+    return sum(len(layer) for layer in layers)
+
+def apply_network(columns, layers):
+    """
+    Runs the network over a list of 1-D column arrays (one per position).
+    Columns are exchanged by reference, so each comparator costs one np.minimum
+    and one np.maximum and no copies.
+    """
+    spare = np.empty_like(columns[0])
+
+    for layer in layers:
+        for i, j in layer:
+            low, high = columns[i], columns[j]
+            np.minimum(low, high, out=spare)
+            np.maximum(low, high, out=high)
+            columns[i], spare = spare, low
+
+    return columns
+
+def sort_rows(array, kind="auto", chunk_rows=8192):
+    """
+    Returns a copy of the 2-D array with every row sorted in ascending order.
+    Rows are handled in chunks of chunk_rows so the columns of a chunk stay in cache.
+    NaN is not supported: np.minimum/np.maximum propagate it to both outputs.
+    """
+    array = np.asarray(array)
+    if array.ndim != 2:
+        raise ValueError("sort_rows expects a 2-D array")
+
+    rows, width = array.shape
+    result = np.empty_like(array)
+    layers = network(width, kind)
+
+    if width < 2 or rows == 0:
+        result[...] = array
+        return result
+
+    for start in range(0, rows, chunk_rows):
+        chunk = array[start:start + chunk_rows]
+        # Transposed copy: each position becomes a contiguous column
+        columns = list(np.ascontiguousarray(chunk.T))
+        apply_network(columns, layers)
+        result[start:start + chunk_rows] = np.stack(columns, axis=1)
+
+    return result
+
+def is_sorting_network(n, layers):
+    """Checks a network with the 0-1 principle: it must sort all 2^n rows of zeros and ones."""
+    inputs = ((np.arange(1 << n)[:, None] >> np.arange(n)) & 1).astype(np.uint8)
+    output = _apply_to_rows(inputs, layers)
+    return bool(np.all(output[:, :-1] <= output[:, 1:]))
+
+def _apply_to_rows(array, layers):
+    """Applies any network (not only the cached ones) to all rows in a single chunk."""
+    columns = list(np.ascontiguousarray(array.T))
+    apply_network(columns, layers)
+    return np.stack(columns, axis=1)
+
+def sort_rows_python(array):
+    """Baseline: sorts each row with Python's sorted."""
+    return [sorted(row) for row in array.tolist()]
+
+def benchmark(widths=(4, 8, 16, 32, 64), rows=200_000, python_rows=20_000):
+    """
+    Compares the networks with np.sort(axis=1) and a per-row Python sort,
+    all on the same random int64 batch. Python is timed on fewer rows and scaled.
+    """
+    print(f"Sorting {rows} random rows (times in seconds)")
+    print(f"{'Width':<7} {'np.sort':<10} {'optimal':<10} {'oe-merge':<10} {'bitonic':<10} "
+          f"{'oe-trans':<10} {'python':<10}")
+
+    rng = np.random.default_rng(42)
+    for width in widths:
+        array = rng.integers(0, 1 << 30, size=(rows, width))
+        expected = np.sort(array, axis=1)
+
+        start = time.perf_counter()
+        np.sort(array, axis=1)
+        timings = [time.perf_counter() - start]
+
+        for kind in ("optimal", "odd_even_merge", "bitonic", "odd_even_transposition"):
+            if kind == "optimal" and width not in OPTIMAL_NETWORKS:
+                timings.append(None)
+                continue
+            start = time.perf_counter()
+            result = sort_rows(array, kind)
+            timings.append(time.perf_counter() - start)
+            assert np.array_equal(result, expected), kind
+
+        start = time.perf_counter()
+        sort_rows_python(array[:python_rows])
+        timings.append((time.perf_counter() - start) * rows / python_rows)
+
+        print(f"{width:<7} " + " ".join(f"{t:<10.4f}" if t is not None else f"{'-':<10}" for t in timings))
+
+def _bench_sort_rows(width, method):
+    """Factory for bench.py: n random rows of the given width."""
+    def factory(n):
+        array = np.random.default_rng(42).integers(0, 1 << 30, size=(n, width))
+        if method == "np.sort":
+            return lambda: np.sort(array, axis=1)
+        if method == "python":
+            return lambda: sort_rows_python(array)
+        return lambda: sort_rows(array, method)
+    return factory
+
+# Benchmarks registered for bench.py: name -> (factory(n), default sizes)
+BENCHMARKS = {
+    f"sort_rows/w{width}/{method}": (_bench_sort_rows(width, method), (10000, 100000))
+    for width in (8, 32)
+    for method in ("np.sort", "auto", "bitonic", "python")
+}
+
+if __name__ == "__main__":
+    for width in (4, 8, 16, 32, 64):
+        counts = {kind: comparator_count(network(width, kind))
+                  for kind in NETWORK_KINDS[2:] + (("optimal",) if width in OPTIMAL_NETWORKS else ())}
+        print(f"Width {width}: comparators {counts}")
+
+    random_rows = np.array([[random.randint(0, 99) for _ in range(8)] for _ in range(3)])
+    print(random_rows, "\n->\n", sort_rows(random_rows))
+
+    benchmark()
@@ -1,6 +1,9 @@
 # Implementação de uma árvore AVL (Adelson-Velsky e Landis)
 # Autor: Matheus Cerqueira de Jesus
 
+from bloom_filter import MembershipFilter
+from tree_stats import TreeStats
+
 class AVLNode:
     """Nó da árvore AVL que armazena chave, altura e referências para filhos"""
     def __init__(self, key):
@@ -9,6 +12,10 @@ class AVLNode:
         self.right = None
         self.height = 1
     
+    def copy_key(self, other):
+        """Copia a chave de outro nó (subclasses copiam também os dados da chave)"""
+        self.key = other.key
+    
     def __str__(self):
         return f"({self.key}, h={self.height})"
 
@@ -17,10 +24,31 @@ class AVLTree:
     Implementação de árvore AVL
     - Propriedade BST: chaves seguem ordenação de árvore binária de busca
     - Propriedade AVL: diferença de altura entre subárvores ≤ 1
+    - instrument=True conta comparações, rotações e profundidades em self.stats;
+      desligado, os métodos originais são usados sem nenhum custo extra
+    - filter_fp_rate liga um filtro de Bloom (self.filter) que responde em O(1)
+      buscas por chaves ausentes; None (padrão) deixa a árvore sem filtro
+    - node_class define o tipo de nó criado nas inserções, para subclasses que
+      aumentam o nó com dados extras (mantidos em _update_height, ou levados
+      junto com a chave por copy_key quando a remoção copia o sucessor)
     """
     
-    def __init__(self):
+    node_class = AVLNode
+    
+    def __init__(self, instrument=False, filter_fp_rate=None):
         self.root = None
+        self.stats = None
+        self.filter = None
+        
+        if instrument:
+            # Versões instrumentadas substituem os métodos apenas nesta instância
+            self.stats = TreeStats()
+            self._insert_recursive = self._insert_instrumented
+            self._search_recursive = self._search_instrumented
+            self._delete_recursive = self._delete_instrumented
+        
+        if filter_fp_rate is not None:
+            self.filter = MembershipFilter(self, filter_fp_rate)
     
     def _get_height(self, node):
         """Retorna a altura do nó (0 se None)"""
@@ -78,7 +106,7 @@ class AVLTree:
         """Inserção recursiva mantendo propriedade AVL"""
         # Passo 1: Inserção normal BST
         if node is None:
-            return AVLNode(key)
+            return self.node_class(key)
         
         if key < node.key:
             node.left = self._insert_recursive(node.left, key)
@@ -161,7 +189,7 @@ class AVLTree:
             
             # Nó com dois filhos: obter sucessor em ordem
             temp = self._get_min_value_node(node.right)
-            node.key = temp.key
+            node.copy_key(temp)
             node.right = self._delete_recursive(node.right, temp.key)
         
         # Passo 2: Atualizar altura do nó atual
@@ -192,31 +220,152 @@ class AVLTree:
         
         return node
     
+    def _insert_instrumented(self, node, key, depth=1):
+        """Inserção recursiva contando comparações, rotações e profundidade"""
+        stats = self.stats
+        
+        if node is None:
+            stats.insert_depths[depth] += 1
+            return self.node_class(key)
+        
+        stats.comparisons += 1
+        if key < node.key:
+            node.left = self._insert_instrumented(node.left, key, depth + 1)
+        else:
+            stats.comparisons += 1
+            if key > node.key:
+                node.right = self._insert_instrumented(node.right, key, depth + 1)
+            else:
+                return node
+        
+        self._update_height(node)
+        balance = self._get_balance(node)
+        
+        if balance > 1:
+            if key < node.left.key:
+                stats.rotations["LL"] += 1
+                return self._rotate_right(node)
+            stats.rotations["LR"] += 1
+            node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        
+        if balance < -1:
+            if key > node.right.key:
+                stats.rotations["RR"] += 1
+                return self._rotate_left(node)
+            stats.rotations["RL"] += 1
+            node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        
+        return node
+    
+    def _search_instrumented(self, node, key):
+        """Busca contando comparações e nós visitados"""
+        stats = self.stats
+        visited = 0
+        
+        while node is not None:
+            visited += 1
+            stats.comparisons += 1
+            if key == node.key:
+                stats.record_search(visited)
+                return True
+            stats.comparisons += 1
+            node = node.left if key < node.key else node.right
+        
+        stats.record_search(visited)
+        return False
+    
+    def _delete_instrumented(self, node, key):
+        """Remoção recursiva contando comparações e rotações"""
+        stats = self.stats
+        
+        if node is None:
+            return node
+        
+        stats.comparisons += 1
+        if key < node.key:
+            node.left = self._delete_instrumented(node.left, key)
+        else:
+            stats.comparisons += 1
+            if key > node.key:
+                node.right = self._delete_instrumented(node.right, key)
+            else:
+                if node.left is None:
+                    return node.right
+                elif node.right is None:
+                    return node.left
+                
+                temp = self._get_min_value_node(node.right)
+                node.copy_key(temp)
+                node.right = self._delete_instrumented(node.right, temp.key)
+        
+        self._update_height(node)
+        balance = self._get_balance(node)
+        
+        if balance > 1:
+            if self._get_balance(node.left) >= 0:
+                stats.rotations["LL"] += 1
+                return self._rotate_right(node)
+            stats.rotations["LR"] += 1
+            node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        
+        if balance < -1:
+            if self._get_balance(node.right) <= 0:
+                stats.rotations["RR"] += 1
+                return self._rotate_left(node)
+            stats.rotations["RL"] += 1
+            node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        
+        return node
+    
+    def iter_inorder(self):
+        """Percurso em ordem iterativo com pilha explícita (gera as chaves sob demanda)"""
+        stack = []
+        node = self.root
+        
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+    
+    def iter_preorder(self):
+        """Percurso em pré-ordem iterativo, gera pares (chave, altura)"""
+        stack = [self.root] if self.root is not None else []
+        
+        while stack:
+            node = stack.pop()
+            yield (node.key, node.height)
+            # Direita empilhada antes para a esquerda sair primeiro
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+    
+    def _iter_nodes(self):
+        """Gera todos os nós (ordem qualquer), sem recursão"""
+        stack = [self.root] if self.root is not None else []
+        
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+    
     def inorder_traversal(self):
         """Percurso em ordem (retorna chaves ordenadas)"""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-    
-    def _inorder_recursive(self, node, result):
-        """Percurso em ordem recursivo"""
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_recursive(node.right, result)
+        return list(self.iter_inorder())
     
     def preorder_traversal(self):
         """Percurso em pré-ordem (mostra estrutura da árvore)"""
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
-    
-    def _preorder_recursive(self, node, result):
-        """Percurso em pré-ordem recursivo"""
-        if node is not None:
-            result.append((node.key, node.height))
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        return list(self.iter_preorder())
     
     def is_empty(self):
         """Verifica se a árvore está vazia"""
@@ -228,29 +377,38 @@ class AVLTree:
     
     def size(self):
         """Conta o número de nós na árvore"""
-        return self._size_recursive(self.root)
-    
-    def _size_recursive(self, node):
-        """Contagem recursiva de nós"""
-        if node is None:
-            return 0
-        return 1 + self._size_recursive(node.left) + self._size_recursive(node.right)
+        return sum(1 for _ in self._iter_nodes())
     
     def is_balanced(self):
-        """Verifica se a árvore está balanceada (propriedade AVL)"""
-        return self._is_balanced_recursive(self.root)
-    
-    def _is_balanced_recursive(self, node):
-        """Verificação recursiva de balanceamento"""
-        if node is None:
-            return True
+        """Verifica se a árvore está balanceada (propriedade AVL), em uma passada O(n)"""
+        return all(abs(self._get_balance(node)) <= 1 for node in self._iter_nodes())
+    
+    def validate(self):
+        """
+        Verifica em uma única passada O(n), sem recursão:
+        - ordem BST (cada nó dentro dos limites herdados dos ancestrais)
+        - alturas armazenadas (altura = 1 + maior altura dos filhos)
+        - balanceamento AVL (|fator| ≤ 1)
+        As verificações são locais a cada nó, então valem em qualquer ordem de visita.
+        """
+        stack = [(self.root, None, None)] if self.root is not None else []
         
-        balance = self._get_balance(node)
-        if abs(balance) > 1:
-            return False
+        while stack:
+            node, low, high = stack.pop()
+            
+            if (low is not None and not low < node.key) or (high is not None and not node.key < high):
+                return False
+            if node.height != 1 + max(self._get_height(node.left), self._get_height(node.right)):
+                return False
+            if abs(self._get_balance(node)) > 1:
+                return False
+            
+            if node.left is not None:
+                stack.append((node.left, low, node.key))
+            if node.right is not None:
+                stack.append((node.right, node.key, high))
         
-        return (self._is_balanced_recursive(node.left) and 
-                self._is_balanced_recursive(node.right))
+        return True
     
     def print_tree(self, node=None, level=0, prefix="Root: "):
         """Imprime a estrutura da árvore de forma visual"""
@@ -285,6 +443,7 @@ def main():
     print(f"\nTamanho da árvore: {avl.size()}")
     print(f"Altura da árvore: {avl.height()}")
     print(f"Árvore balanceada: {avl.is_balanced()}")
+    print(f"Árvore válida (BST + AVL + alturas): {avl.validate()}")
     
     # Mostrar estrutura da árvore
     print("\nEstrutura da árvore:")
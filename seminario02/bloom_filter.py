@@ -0,0 +1,157 @@
+# Filtro de Bloom para responder buscas negativas nas árvores em O(1)
+# Autor: Matheus Cerqueira de Jesus
+# - BloomFilter: vetor de bits com k funções hash (hash duplo h1 + i*h2)
+# - MembershipFilter: liga um BloomFilter a uma árvore (AVLTree/Treap); buscas por
+#   chaves que o filtro garante ausentes não percorrem a árvore
+
+import math
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+
+class BloomFilter:
+    """
+    Filtro de Bloom dimensionado pela capacidade e taxa de falsos positivos
+    - m = -n ln(p) / ln(2)^2 bits e k = (m / n) ln(2) funções hash
+    - Não tem remoção: chaves removidas continuam "talvez presentes"
+    """
+    
+    def __init__(self, capacity, fp_rate=0.01):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _hashes(self, key):
+        """
+        Par (h1, h2) para o hash duplo h1 + i*h2, a partir de uma única
+        multiplicação de Knuth (h2 ímpar)
+        """
+        h = (hash(key) * _GOLDEN_64) & _MASK_64
+        return h >> 32, (h & 0xFFFFFFFF) | 1
+    
+    def add(self, key):
+        """Adiciona uma chave ao filtro"""
+        bits = self.bits
+        m = self.num_bits
+        index, step = self._hashes(key)
+        
+        for _ in range(self.num_hashes):
+            index %= m
+            bits[index >> 3] |= 1 << (index & 7)
+            index += step
+        self.count += 1
+    
+    def __contains__(self, key):
+        """False garante ausência; True significa "talvez presente" """
+        bits = self.bits
+        m = self.num_bits
+        index, step = self._hashes(key)
+        
+        # Para no primeiro bit desligado (na maioria das ausências, logo no início)
+        for _ in range(self.num_hashes):
+            index %= m
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+            index += step
+        return True
+
+class MembershipFilter:
+    """
+    Filtro de pertinência ligado a uma árvore
+    - insert: insere na árvore e no filtro
+    - search: se o filtro garante ausência, retorna False sem percorrer a árvore
+    - delete: remove da árvore; o filtro é reconstruído a partir da árvore quando
+      as remoções passam de rebuild_ratio do número de chaves (Bloom não remove)
+    - O filtro dobra de capacidade quando enche, mantendo a taxa de falsos positivos
+    Os métodos da árvore são substituídos apenas na instância, como na instrumentação.
+    """
+    
+    def __init__(self, tree, fp_rate=0.01, capacity=1024, rebuild_ratio=0.25):
+        self.tree = tree
+        self.fp_rate = fp_rate
+        self.rebuild_ratio = rebuild_ratio
+        self.bloom = BloomFilter(capacity, fp_rate)
+        
+        self.saved_walks = 0
+        self.false_positives = 0
+        self.deletes_since_rebuild = 0
+        self.rebuilds = 0
+        
+        # Métodos originais (da classe) e substituição na instância
+        self._tree_insert = tree.insert
+        self._tree_search = tree.search
+        self._tree_delete = tree.delete
+        tree.insert = self.insert
+        tree.search = self.search
+        tree.delete = self.delete
+    
+    def insert(self, key, *args):
+        """Insere na árvore e no filtro (chave repetida não conta para a capacidade)"""
+        # Só há chance de ser repetida se o filtro diz "talvez presente"
+        if key in self.bloom and self._in_tree(key):
+            return
+        
+        self._tree_insert(key, *args)
+        self.bloom.add(key)
+        
+        if self.bloom.count > self.bloom.capacity:
+            self.rebuild(2 * self.bloom.capacity)
+    
+    def _in_tree(self, key):
+        """Busca direta nos nós, sem passar pela instrumentação nem pelos contadores"""
+        node = self.tree.root
+        while node is not None:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+    
+    def search(self, key):
+        """Busca com o filtro na frente da árvore"""
+        if key not in self.bloom:
+            self.saved_walks += 1
+            return False
+        
+        found = self._tree_search(key)
+        if not found:
+            self.false_positives += 1
+        return found
+    
+    def delete(self, key):
+        """Remove da árvore e reconstrói o filtro periodicamente"""
+        # Chaves ausentes não mudam a árvore nem entram na contagem de remoções
+        if key not in self.bloom or not self._in_tree(key):
+            return
+        
+        self._tree_delete(key)
+        self.deletes_since_rebuild += 1
+        
+        if self.deletes_since_rebuild > self.rebuild_ratio * max(1, self.bloom.count):
+            self.rebuild()
+    
+    def rebuild(self, capacity=None):
+        """Reconstrói o filtro com as chaves atuais da árvore"""
+        keys = list(self.tree.iter_inorder())
+        capacity = max(capacity or self.bloom.capacity, 2 * len(keys), 1)
+        
+        self.bloom = BloomFilter(capacity, self.fp_rate)
+        for key in keys:
+            self.bloom.add(key)
+        
+        self.deletes_since_rebuild = 0
+        self.rebuilds += 1
+    
+    def stats(self):
+        """Contadores do filtro em um dicionário"""
+        return {
+            "saved_walks": self.saved_walks,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+            "capacity": self.bloom.capacity,
+            "num_bits": self.bloom.num_bits,
+            "num_hashes": self.bloom.num_hashes,
+        }
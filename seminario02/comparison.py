@@ -6,6 +6,7 @@ import random
 import sys
 from treap import Treap
 from avl_tree import AVLTree
+from hash_table import LinkedListHashTable, OpenAddressingHashTable
 
 class PerformanceAnalyzer:
     """Classe para análise de performance entre Treap e AVL"""
@@ -153,6 +154,98 @@ class PerformanceAnalyzer:
         print("-" * 50)
         print(f"{'MÉDIA':<10} {avg_treap:<12.6f} {avg_avl:<12.6f} {avg_ratio:<12.2f}")
 
+    def test_point_lookups(self, data_sizes, datasets):
+        """Compara buscas pontuais nas árvores e nas tabelas hash"""
+        print("\n=== Teste de Buscas Pontuais (Árvores x Hash) ===")
+        
+        structures = {
+            "Treap": Treap,
+            "AVL": AVLTree,
+            "Encad.": LinkedListHashTable,
+            "Linear": lambda: OpenAddressingHashTable(probing="linear"),
+            "Quadr.": lambda: OpenAddressingHashTable(probing="quadratic"),
+            "Duplo": lambda: OpenAddressingHashTable(probing="double"),
+        }
+        
+        header = f"{'Teste':<10} " + " ".join(f"{name + ' (s)':<12}" for name in structures)
+        print(header)
+        print("-" * len(header))
+        
+        times = {name: [] for name in structures}
+        
+        for i, (key, data) in enumerate(datasets.items()):
+            row = f"{key:<10} "
+            
+            for name, factory in structures.items():
+                # Construir estrutura
+                structure = factory()
+                for x in data:
+                    structure.insert(x)
+                
+                # Metade das buscas por chaves presentes, metade por ausentes
+                search_keys = data[:len(data)//2] + [-x for x in data[:len(data)//2]]
+                
+                elapsed, _ = self.measure_time(
+                    lambda: [structure.search(x) for x in search_keys]
+                )
+                times[name].append(elapsed)
+                row += f"{elapsed:<12.6f} "
+            
+            print(row)
+        
+        print("-" * len(header))
+        print(f"{'MÉDIA':<10} " + " ".join(
+            f"{sum(values) / len(values):<12.6f}" for values in times.values()))
+
+    def test_negative_lookups(self, data_sizes, datasets, fp_rate=0.01):
+        """Buscas por chaves ausentes com e sem filtro de Bloom na frente das árvores"""
+        print("\n=== Teste de Buscas Negativas (filtro de Bloom) ===")
+        print(f"{'Teste':<10} {'Estrutura':<10} {'Sem filtro (s)':<15} {'Com filtro (s)':<15} "
+              f"{'Caminhadas evitadas':<20} {'Falsos positivos'}")
+        print("-" * 90)
+        
+        for key, data in datasets.items():
+            # Chaves entre as existentes: a busca sem filtro desce até uma folha
+            missing_keys = [x + 0.5 for x in data]
+            
+            for name, cls in (("Treap", Treap), ("AVL", AVLTree)):
+                plain = cls()
+                guarded = cls(filter_fp_rate=fp_rate)
+                for x in data:
+                    plain.insert(x)
+                    guarded.insert(x)
+                
+                plain_time, _ = self.measure_time(
+                    lambda: [plain.search(x) for x in missing_keys]
+                )
+                guarded_time, _ = self.measure_time(
+                    lambda: [guarded.search(x) for x in missing_keys]
+                )
+                
+                stats = guarded.filter.stats()
+                print(f"{key:<10} {name:<10} {plain_time:<15.6f} {guarded_time:<15.6f} "
+                      f"{stats['saved_walks']:<20} {stats['false_positives']}")
+    
+    def test_operation_counters(self, data_sizes, datasets):
+        """Mostra os contadores das árvores instrumentadas (inserção + busca + remoção)"""
+        print("\n=== Contadores de Operações ===")
+        print(f"{'Teste':<10} {'Estrutura':<10} {'Comparações':<13} {'Rotações':<10} "
+              f"{'Nós/busca':<10} {'Casos de rotação'}")
+        print("-" * 80)
+        
+        for key, data in datasets.items():
+            for name, tree in (("Treap", Treap(instrument=True)), ("AVL", AVLTree(instrument=True))):
+                for x in data:
+                    tree.insert(x)
+                for x in data:
+                    tree.search(x)
+                for x in data[:len(data)//2]:
+                    tree.delete(x)
+                
+                stats = tree.stats.as_dict()
+                print(f"{key:<10} {name:<10} {stats['comparisons']:<13} {stats['total_rotations']:<10} "
+                      f"{stats['nodes_per_search']:<10.2f} {stats['rotations']}")
+
 def compare_properties():
     """Compara propriedades estruturais das duas árvores"""
     print("=== Comparação de Propriedades Estruturais ===\n")
@@ -211,6 +304,109 @@ def compare_theoretical_aspects():
     for aspect, treap_val, avl_val in aspects:
         print(f"{aspect:<25} {treap_val:<20} {avl_val:<20}")
 
+def _shuffled_keys(n):
+    """Chaves 1..n em ordem aleatória"""
+    keys = list(range(1, n + 1))
+    random.shuffle(keys)
+    return keys
+
+def _bench_insert(factory):
+    """Factory para o bench.py: inserção de n chaves embaralhadas"""
+    def bench(n):
+        keys = _shuffled_keys(n)
+        structure = factory()
+        return lambda: [structure.insert(x) for x in keys]
+    return bench
+
+def _bench_build(factory):
+    """Factory para o bench.py: constrói a estrutura e a retorna (medição de memória)"""
+    def bench(n):
+        keys = _shuffled_keys(n)
+        
+        def run():
+            structure = factory()
+            for x in keys:
+                structure.insert(x)
+            return structure
+        return run
+    return bench
+
+def _bench_search(factory):
+    """Factory para o bench.py: busca de todas as chaves após construir a estrutura"""
+    def bench(n):
+        keys = _shuffled_keys(n)
+        structure = factory()
+        for x in keys:
+            structure.insert(x)
+        return lambda: [structure.search(x) for x in keys]
+    return bench
+
+def _bench_delete(factory):
+    """Factory para o bench.py: remoção de metade das chaves"""
+    def bench(n):
+        keys = _shuffled_keys(n)
+        structure = factory()
+        for x in keys:
+            structure.insert(x)
+        delete_keys = keys[:n // 2]
+        return lambda: [structure.delete(x) for x in delete_keys]
+    return bench
+
+def _bench_instrumented(factory):
+    """
+    Factory para o bench.py: inserção + busca com a árvore instrumentada.
+    Os contadores vão para o relatório através do atributo counters.
+    """
+    def bench(n):
+        keys = _shuffled_keys(n)
+        tree = factory(instrument=True)
+        
+        def run():
+            for x in keys:
+                tree.insert(x)
+            for x in keys:
+                tree.search(x)
+        
+        run.counters = tree.stats.as_dict
+        return run
+    return bench
+
+def _bench_missing(factory):
+    """Factory para o bench.py: buscas por n chaves ausentes"""
+    def bench(n):
+        keys = _shuffled_keys(n)
+        structure = factory()
+        for x in keys:
+            structure.insert(x)
+        missing_keys = [x + 0.5 for x in keys]
+        return lambda: [structure.search(x) for x in missing_keys]
+    return bench
+
+_STRUCTURES = {
+    "Treap": Treap,
+    "AVLTree": AVLTree,
+    "LinkedListHashTable": LinkedListHashTable,
+    "OpenAddressingHashTable": OpenAddressingHashTable,
+}
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    f"{name}/{operation}": (bench(factory), (10000, 100000))
+    for name, factory in _STRUCTURES.items()
+    for operation, bench in (("build", _bench_build),
+                             ("insert", _bench_insert),
+                             ("search", _bench_search),
+                             ("delete", _bench_delete))
+}
+
+for _name, _cls in (("Treap", Treap), ("AVLTree", AVLTree)):
+    BENCHMARKS[f"{_name}/search_missing"] = (_bench_missing(_cls), (10000, 100000))
+    BENCHMARKS[f"{_name}+bloom/search_missing"] = (
+        _bench_missing(lambda cls=_cls: cls(filter_fp_rate=0.01)), (10000, 100000))
+
+BENCHMARKS["Treap/instrumented"] = (_bench_instrumented(Treap), (10000,))
+BENCHMARKS["AVLTree/instrumented"] = (_bench_instrumented(AVLTree), (10000,))
+
 def main():
     """Função principal de comparação"""
     import random
@@ -240,6 +436,9 @@ def main():
     analyzer.test_insertions(data_sizes, datasets)
     analyzer.test_searches(data_sizes, datasets)
     analyzer.test_deletions(data_sizes, datasets)
+    analyzer.test_point_lookups(data_sizes, datasets)
+    analyzer.test_negative_lookups(data_sizes, datasets)
+    analyzer.test_operation_counters(data_sizes, datasets)
     
     # # Comparações estruturais
     # compare_properties()
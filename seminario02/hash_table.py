@@ -0,0 +1,235 @@
+# Implementação de tabelas hash (conjunto de chaves) em Python, espelhando aula10/hash-table
+# Autor: Matheus Cerqueira de Jesus
+# - Encadeamento: cada posição guarda uma lista de chaves
+# - Endereçamento aberto: sondagem linear, quadrática ou hash duplo, com remoção por lápide
+
+# Constante de Knuth (parte fracionária da razão áurea em 64 bits)
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+
+def hash_division(key, size):
+    """Função hash da divisão"""
+    return hash(key) % size
+
+def hash_multiplication(key, size):
+    """Função hash da multiplicação (Knuth), usa os bits altos do produto"""
+    return (((hash(key) * _GOLDEN_64) & 0xFFFFFFFFFFFFFFFF) >> 32) % size
+
+class LinkedListHashTable:
+    """
+    Tabela hash por encadeamento
+    - Cada posição da tabela guarda uma lista com as chaves que colidiram
+    - A tabela dobra de tamanho quando o fator de carga passa do limite
+    """
+    
+    def __init__(self, size=8, max_load_factor=1.0):
+        self.table = [[] for _ in range(size)]
+        self.count = 0
+        self.max_load_factor = max_load_factor
+    
+    def load_factor(self):
+        """Retorna o fator de carga (chaves / posições)"""
+        return self.count / len(self.table)
+    
+    def _resize(self, new_size):
+        """Redistribui as chaves em uma nova tabela"""
+        old_table = self.table
+        self.table = [[] for _ in range(new_size)]
+        for bucket in old_table:
+            for key in bucket:
+                self.table[hash_division(key, new_size)].append(key)
+    
+    def insert(self, key):
+        """Insere uma chave (chaves duplicadas não são permitidas)"""
+        bucket = self.table[hash_division(key, len(self.table))]
+        if key in bucket:
+            return
+        
+        bucket.append(key)
+        self.count += 1
+        
+        if self.count > self.max_load_factor * len(self.table):
+            self._resize(2 * len(self.table))
+    
+    def search(self, key):
+        """Busca uma chave na tabela"""
+        return key in self.table[hash_division(key, len(self.table))]
+    
+    def delete(self, key):
+        """Remove uma chave da tabela"""
+        bucket = self.table[hash_division(key, len(self.table))]
+        if key in bucket:
+            bucket.remove(key)
+            self.count -= 1
+    
+    def size(self):
+        """Número de chaves na tabela"""
+        return self.count
+    
+    def is_empty(self):
+        """Verifica se a tabela está vazia"""
+        return self.count == 0
+
+# Marca de posição removida: a busca continua a sondagem, a inserção pode reaproveitar
+_TOMBSTONE = object()
+
+class OpenAddressingHashTable:
+    """
+    Tabela hash por endereçamento aberto em um vetor
+    - Sondagem: "linear", "quadratic" (números triangulares) ou "double" (hash duplo)
+    - Remoção com lápide, para não quebrar sequências de sondagem
+    - O tamanho é sempre potência de 2, assim toda sondagem visita todas as posições
+    - Redimensionamento automático quando (chaves + lápides) / posições passa do limite
+    """
+    
+    PROBING = ("linear", "quadratic", "double")
+    
+    def __init__(self, size=8, probing="linear", max_load_factor=0.7):
+        if probing not in self.PROBING:
+            raise ValueError(f"Sondagem inválida: {probing}")
+        # Com fator 1 a tabela pode encher e a sondagem não acha posição livre
+        if not 0 < max_load_factor < 1:
+            raise ValueError(f"Fator de carga deve estar em (0, 1): {max_load_factor}")
+        
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        
+        self.table = [None] * capacity
+        self.probing = probing
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self.tombstones = 0
+    
+    def load_factor(self):
+        """Retorna o fator de carga (chaves / posições)"""
+        return self.count / len(self.table)
+    
+    def _probe_start(self, key):
+        """Retorna a posição inicial, o primeiro passo e o incremento do passo"""
+        key_hash = hash(key)
+        capacity = len(self.table)
+        index = hash_division(key_hash, capacity)
+        
+        if self.probing == "linear":
+            return index, 1, 0
+        if self.probing == "quadratic":
+            # Passos 1, 2, 3, ... -> deslocamentos triangulares i(i+1)/2
+            return index, 1, 1
+        # Hash duplo: passo ímpar é primo com o tamanho (potência de 2)
+        return index, hash_multiplication(key_hash, capacity) | 1, 0
+    
+    def _find_slot(self, key):
+        """
+        Sonda até achar a chave ou uma posição vazia.
+        Retorna (posição da chave ou None, primeira posição livre encontrada)
+        """
+        table = self.table
+        mask = len(table) - 1
+        index, step, increment = self._probe_start(key)
+        free = None
+        
+        for _ in range(len(table)):
+            item = table[index]
+            if item is None:
+                return None, index if free is None else free
+            if item is _TOMBSTONE:
+                if free is None:
+                    free = index
+            elif item == key:
+                return index, free
+            
+            index = (index + step) & mask
+            step += increment
+        
+        return None, free
+    
+    def _resize(self, new_size):
+        """Reinsere as chaves em um novo vetor, descartando as lápides"""
+        old_table = self.table
+        self.table = [None] * new_size
+        self.count = 0
+        self.tombstones = 0
+        
+        for item in old_table:
+            if item is not None and item is not _TOMBSTONE:
+                _, free = self._find_slot(item)
+                self.table[free] = item
+                self.count += 1
+    
+    def insert(self, key):
+        """Insere uma chave (chaves duplicadas não são permitidas)"""
+        found, free = self._find_slot(key)
+        if found is not None:
+            return
+        
+        if self.table[free] is _TOMBSTONE:
+            self.tombstones -= 1
+        self.table[free] = key
+        self.count += 1
+        
+        if self.count + self.tombstones > self.max_load_factor * len(self.table):
+            # Só cresce se as chaves ocupam a tabela; senão apenas limpa as lápides
+            if self.count > self.max_load_factor * len(self.table) / 2:
+                self._resize(2 * len(self.table))
+            else:
+                self._resize(len(self.table))
+    
+    def search(self, key):
+        """Busca uma chave na tabela"""
+        return self._find_slot(key)[0] is not None
+    
+    def delete(self, key):
+        """Remove uma chave da tabela deixando uma lápide"""
+        found, _ = self._find_slot(key)
+        if found is not None:
+            self.table[found] = _TOMBSTONE
+            self.count -= 1
+            self.tombstones += 1
+    
+    def probe_length(self, key):
+        """Número de posições visitadas pela busca da chave"""
+        table = self.table
+        mask = len(table) - 1
+        index, step, increment = self._probe_start(key)
+        
+        for probes in range(1, len(table) + 1):
+            item = table[index]
+            if item is None or (item is not _TOMBSTONE and item == key):
+                return probes
+            index = (index + step) & mask
+            step += increment
+        
+        return len(table)
+    
+    def size(self):
+        """Número de chaves na tabela"""
+        return self.count
+    
+    def is_empty(self):
+        """Verifica se a tabela está vazia"""
+        return self.count == 0
+
+def main():
+    """Função de demonstração das tabelas hash"""
+    print("=== Demonstração das Tabelas Hash ===\n")
+    
+    elements = [10, 5, 15, 3, 7, 12, 18, 1, 4, 6, 8]
+    tables = {
+        "Encadeamento": LinkedListHashTable(),
+        "Sondagem linear": OpenAddressingHashTable(probing="linear"),
+        "Sondagem quadrática": OpenAddressingHashTable(probing="quadratic"),
+        "Hash duplo": OpenAddressingHashTable(probing="double"),
+    }
+    
+    print("Inserindo elementos:", elements)
+    for name, table in tables.items():
+        for elem in elements:
+            table.insert(elem)
+        
+        table.delete(15)
+        found = [key for key in (7, 15, 20) if table.search(key)]
+        print(f"{name:<20} tamanho={table.size():<4} carga={table.load_factor():.2f} "
+              f"encontrados (7, 15, 20): {found}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+# Implementação de uma Treap implícita (rope): sequência indexada por posição
+# Autor: Matheus Cerqueira de Jesus
+import random
+import time
+
+class ImplicitTreapNode:
+    """Nó da Treap implícita: valor, prioridade, tamanho da subárvore e flag de inversão"""
+    __slots__ = ("value", "priority", "size", "reversed", "left", "right")
+
+    def __init__(self, value, priority):
+        self.value = value
+        self.priority = priority
+        self.size = 1
+        self.reversed = False
+        self.left = None
+        self.right = None
+
+def _size(node):
+    """Tamanho da subárvore (0 para None)"""
+    return node.size if node is not None else 0
+
+def _update(node):
+    """Recalcula o tamanho do nó a partir dos filhos"""
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _push(node):
+    """Empurra a inversão pendente para os filhos (lazy propagation)"""
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        if node.left is not None:
+            node.left.reversed = not node.left.reversed
+        if node.right is not None:
+            node.right.reversed = not node.right.reversed
+        node.reversed = False
+
+def _split(node, k):
+    """Divide a subárvore em (primeiros k elementos, restante)"""
+    if node is None:
+        return None, None
+
+    _push(node)
+    if _size(node.left) >= k:
+        left, node.left = _split(node.left, k)
+        _update(node)
+        return left, node
+
+    node.right, right = _split(node.right, k - _size(node.left) - 1)
+    _update(node)
+    return node, right
+
+def _merge(left, right):
+    """Concatena duas subárvores (todos de left antes de todos de right)"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    # Maior prioridade fica em cima (max-heap)
+    if left.priority > right.priority:
+        _push(left)
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+
+    _push(right)
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+class ImplicitTreap:
+    """
+    Treap implícita (rope): a chave de cada nó é sua posição na sequência,
+    obtida dos tamanhos das subárvores, e não é armazenada
+    - inserir/remover no meio, recortar/colar trechos e inverter intervalos em O(log n) esperado
+    - interface parecida com list: len, [i], [i] = x, del [i] / [i:j], insert, append, iter
+    - fatias s[i:j] devolvem uma list (O(log n + k)); cut/splice movem trechos em O(log n)
+    - seed torna as prioridades (e a forma da árvore) reprodutíveis
+    """
+
+    def __init__(self, iterable=(), seed=None):
+        self.root = None
+        self._next_priority = random.Random(seed).random if seed is not None else random.random
+        self.extend(iterable)
+
+    @classmethod
+    def _from_root(cls, root, next_priority):
+        """Cria uma ImplicitTreap em volta de uma subárvore já pronta"""
+        treap = cls.__new__(cls)
+        treap.root = root
+        treap._next_priority = next_priority
+        return treap
+
+    def _build(self, values):
+        """
+        Constrói a árvore de uma sequência em O(n) com pilha (árvore cartesiana):
+        a borda direita fica na pilha e cada novo valor entra à direita dela
+        """
+        stack = []
+        last = None
+        for value in values:
+            node = ImplicitTreapNode(value, self._next_priority())
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                _update(last)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        while stack:
+            last = stack.pop()
+            _update(last)
+
+        return last
+
+    def _index(self, index):
+        """Normaliza um índice como list (negativos contam do fim)"""
+        n = _size(self.root)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("índice fora do intervalo")
+        return index
+
+    def _range(self, i, j):
+        """Normaliza um intervalo [i, j) como uma fatia de list (passo 1)"""
+        start, stop, step = slice(i, j).indices(_size(self.root))
+        if step != 1:
+            raise ValueError("apenas fatias com passo 1 são suportadas")
+        return start, max(start, stop)
+
+    def _node_at(self, index):
+        """Desce até o nó da posição index, empurrando inversões pendentes"""
+        node = self.root
+        while True:
+            _push(node)
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __iter__(self):
+        """Percurso em ordem iterativo com pilha explícita"""
+        stack = []
+        node = self.root
+
+        while stack or node is not None:
+            while node is not None:
+                _push(node)
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                return list(self)[index]
+            start, stop = self._range(index.start, index.stop)
+            # Isola o trecho, copia os valores e cola de volta
+            left, rest = _split(self.root, start)
+            middle, right = _split(rest, stop - start)
+            values = list(self._from_root(middle, self._next_priority))
+            self.root = _merge(_merge(left, middle), right)
+            return values
+        return self._node_at(self._index(index)).value
+
+    def __setitem__(self, index, value):
+        self._node_at(self._index(index)).value = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop = self._range(index.start, index.stop)
+        else:
+            start = self._index(index)
+            stop = start + 1
+        self.cut(start, stop)
+
+    def insert(self, index, value):
+        """Insere value antes da posição index (índices fora do intervalo vão para as pontas, como list)"""
+        n = _size(self.root)
+        if index < 0:
+            index = max(0, index + n)
+        index = min(index, n)
+
+        left, right = _split(self.root, index)
+        node = ImplicitTreapNode(value, self._next_priority())
+        self.root = _merge(_merge(left, node), right)
+
+    def append(self, value):
+        """Adiciona value ao fim da sequência"""
+        self.root = _merge(self.root, ImplicitTreapNode(value, self._next_priority()))
+
+    def extend(self, iterable):
+        """Adiciona todos os valores ao fim, construindo o trecho novo em O(k)"""
+        self.root = _merge(self.root, self._build(iterable))
+
+    def pop(self, index=-1):
+        """Remove e retorna o valor da posição index"""
+        index = self._index(index)
+        value = self._node_at(index).value
+        self.cut(index, index + 1)
+        return value
+
+    def cut(self, i, j):
+        """Remove o trecho [i, j) e o retorna como outra ImplicitTreap, em O(log n)"""
+        start, stop = self._range(i, j)
+        left, rest = _split(self.root, start)
+        middle, right = _split(rest, stop - start)
+        self.root = _merge(left, right)
+        return self._from_root(middle, self._next_priority)
+
+    def splice(self, index, other):
+        """Insere todos os elementos de outra ImplicitTreap antes de index, em O(log n); other fica vazia"""
+        index = min(max(0, index + len(self) if index < 0 else index), len(self))
+        left, right = _split(self.root, index)
+        self.root = _merge(_merge(left, other.root), right)
+        other.root = None
+
+    def reverse(self, i=0, j=None):
+        """Inverte o trecho [i, j) marcando apenas a raiz dele (O(log n))"""
+        start, stop = self._range(i, j)
+        left, rest = _split(self.root, start)
+        middle, right = _split(rest, stop - start)
+        if middle is not None:
+            middle.reversed = not middle.reversed
+        self.root = _merge(_merge(left, middle), right)
+
+    def to_list(self):
+        """Valores da sequência em uma list"""
+        return list(self)
+
+    def height(self):
+        """Calcula a altura percorrendo nível a nível (sem recursão)"""
+        height = 0
+        level = [self.root] if self.root is not None else []
+
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+
+        return height
+
+    def __repr__(self):
+        return f"ImplicitTreap({self.to_list()})"
+
+def _random_operations(operations, seed):
+    """
+    Operações no meio da sequência: (tipo, a, b), com a e b em [0, 1) convertidos
+    em posições pelo tamanho atual, então a mesma lista serve para qualquer n
+    """
+    rng = random.Random(seed)
+    return [(rng.choice(("insert", "delete", "reverse")), rng.random(), rng.random())
+            for _ in range(operations)]
+
+def _positions(n, a, b):
+    """Converte (a, b) em um intervalo [i, j) não vazio de uma sequência de tamanho n"""
+    i = int(a * n)
+    return i, i + 1 + int(b * (n - i - 1))
+
+def _apply_list(sequence, ops):
+    """Aplica as operações em uma list (O(n) cada)"""
+    for kind, a, b in ops:
+        i, j = _positions(len(sequence), a, b)
+        if kind == "insert":
+            sequence.insert(i, -1)
+        elif kind == "delete":
+            del sequence[i]
+        else:
+            sequence[i:j] = sequence[i:j][::-1]
+    return sequence
+
+def _apply_treap(sequence, ops):
+    """Aplica as operações na ImplicitTreap (O(log n) cada)"""
+    for kind, a, b in ops:
+        i, j = _positions(len(sequence), a, b)
+        if kind == "insert":
+            sequence.insert(i, -1)
+        elif kind == "delete":
+            del sequence[i]
+        else:
+            sequence.reverse(i, j)
+    return sequence
+
+def benchmark_against_list(sizes=(10000, 100000, 1000000), operations=2000, seed=42):
+    """
+    Compara list e ImplicitTreap em inserções, remoções e inversões de intervalos
+    aleatórios no meio da sequência, conferindo que o resultado final é o mesmo.
+    """
+    print(f"=== list vs ImplicitTreap ({operations} operações no meio) ===")
+    print(f"{'n':<10} {'list (s)':<12} {'Treap (s)':<12} {'Iguais':<8}")
+    print("-" * 45)
+
+    for n in sizes:
+        ops = _random_operations(operations, seed)
+
+        start = time.perf_counter()
+        expected = _apply_list(list(range(n)), ops)
+        list_time = time.perf_counter() - start
+
+        treap = ImplicitTreap(range(n), seed=seed)
+        start = time.perf_counter()
+        _apply_treap(treap, ops)
+        treap_time = time.perf_counter() - start
+
+        print(f"{n:<10} {list_time:<12.6f} {treap_time:<12.6f} {str(treap.to_list() == expected):<8}")
+
+def _bench_operations(structure):
+    """Factory para o bench.py: 2000 operações no meio de uma sequência de tamanho n"""
+    def bench(n):
+        ops = _random_operations(2000, 42)
+
+        # A construção fica fora da medição nas duas estruturas; as posições são
+        # relativas ao tamanho atual, então repetir a medição sobre a mesma sequência é válido
+        if structure == "list":
+            sequence = list(range(n))
+            return lambda: _apply_list(sequence, ops)
+
+        sequence = ImplicitTreap(range(n), seed=42)
+        return lambda: _apply_treap(sequence, ops)
+    return bench
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    "list/splice_reverse": (_bench_operations("list"), (10000, 100000, 1000000)),
+    "ImplicitTreap/splice_reverse": (_bench_operations("treap"), (10000, 100000, 1000000)),
+}
+
+def main():
+    """Função de demonstração da Treap implícita"""
+    print("=== Demonstração da Treap implícita ===\n")
+
+    sequence = ImplicitTreap("abcdefgh", seed=42)
+    print(f"Sequência: {''.join(sequence)} (tamanho {len(sequence)}, altura {sequence.height()})")
+    print(f"sequence[2] = {sequence[2]}, sequence[-1] = {sequence[-1]}, sequence[2:5] = {sequence[2:5]}")
+
+    sequence.insert(3, "X")
+    print(f"insert(3, 'X'):  {''.join(sequence)}")
+
+    del sequence[0]
+    print(f"del [0]:         {''.join(sequence)}")
+
+    sequence.reverse(1, 6)
+    print(f"reverse(1, 6):   {''.join(sequence)}")
+
+    piece = sequence.cut(0, 3)
+    print(f"cut(0, 3):       {''.join(sequence)} + trecho {''.join(piece)}")
+
+    sequence.splice(len(sequence), piece)
+    print(f"splice no fim:   {''.join(sequence)}\n")
+
+    benchmark_against_list()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+# Servidor chave-valor assíncrono sobre os índices Treap/AVL
+# Autor: Matheus Cerqueira de Jesus
+#
+# Protocolo binário (inteiros em ordem de rede):
+#   requisição: "!IBqq" -> (id, operação, chave, argumento)
+#       GET chave | PUT chave valor | DELETE chave | RANGE início fim (inclusivo)
+#   resposta:   "!IBI"  -> (id, status, n) seguida de n pares "!qq" (chave, valor)
+# Várias requisições podem ser enviadas sem esperar respostas (pipelining); o
+# servidor executa tudo o que chegou em uma leitura como um lote e responde com
+# uma única escrita.
+import argparse
+import asyncio
+import multiprocessing
+import random
+import struct
+import time
+
+from avl_tree import AVLNode, AVLTree
+from treap import Treap, TreapNode
+from tree_stats import percentile
+
+REQUEST = struct.Struct("!IBqq")
+RESPONSE = struct.Struct("!IBI")
+PAIR = struct.Struct("!qq")
+
+OP_GET, OP_PUT, OP_DELETE, OP_RANGE = 1, 2, 3, 4
+STATUS_OK, STATUS_NOT_FOUND, STATUS_ERROR = 0, 1, 2
+
+class _TreapEntry(TreapNode):
+    """Nó da Treap que também guarda o valor da chave"""
+    __slots__ = ("value",)
+
+class _AVLEntry(AVLNode):
+    """Nó AVL que também guarda o valor da chave"""
+
+    def copy_key(self, other):
+        """A remoção copia o sucessor para este nó: o valor vai junto com a chave"""
+        super().copy_key(other)
+        self.value = other.value
+
+class _TreapIndex(Treap):
+    """Treap cujos nós guardam os valores"""
+    node_class = _TreapEntry
+
+class _AVLIndex(AVLTree):
+    """AVLTree cujos nós guardam os valores"""
+    node_class = _AVLEntry
+
+STRUCTURES = {
+    "Treap": _TreapIndex,
+    "AVLTree": _AVLIndex,
+}
+
+def _find(node, key):
+    """Nó com a chave key, ou None (descida iterativa a partir de node)"""
+    while node is not None and node.key != key:
+        node = node.left if key < node.key else node.right
+    return node
+
+def _iter_range(node, low, high):
+    """Nós com chave em [low, high] em ordem, podando subárvores fora do intervalo (sem recursão)"""
+    stack = []
+
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            # À esquerda só há chaves menores: inútil se node.key já é < low
+            node = node.left if node.key >= low else None
+        node = stack.pop()
+        if node.key > high:
+            return
+        if node.key >= low:
+            yield node
+        node = node.right
+
+class IndexServer:
+    """
+    Serviço chave-valor sobre a árvore (Treap ou AVLTree): cada nó guarda a chave
+    e o seu valor, então GET, PUT e DELETE descem pela árvore e RANGE a percorre em ordem
+    - cada conexão é lida em blocos; todas as requisições completas de um bloco
+      formam um lote executado de uma vez, no mesmo passo do event loop
+    - requests e batches contam requisições e lotes (requests / batches = tamanho médio)
+    """
+
+    def __init__(self, structure="Treap", **tree_options):
+        if structure not in STRUCTURES:
+            raise ValueError(f"Estrutura inválida: {structure}")
+
+        self.tree = STRUCTURES[structure](**tree_options)
+        self.requests = 0
+        self.batches = 0
+
+    def execute(self, request_id, op, key, argument):
+        """Executa uma requisição e retorna a resposta já serializada"""
+        if op == OP_GET:
+            node = _find(self.tree.root, key)
+            if node is None:
+                return RESPONSE.pack(request_id, STATUS_NOT_FOUND, 0)
+            return RESPONSE.pack(request_id, STATUS_OK, 1) + PAIR.pack(key, node.value)
+
+        if op == OP_PUT:
+            node = _find(self.tree.root, key)
+            if node is None:
+                self.tree.insert(key)
+                node = _find(self.tree.root, key)
+            node.value = argument
+            return RESPONSE.pack(request_id, STATUS_OK, 0)
+
+        if op == OP_DELETE:
+            if _find(self.tree.root, key) is None:
+                return RESPONSE.pack(request_id, STATUS_NOT_FOUND, 0)
+            self.tree.delete(key)
+            return RESPONSE.pack(request_id, STATUS_OK, 0)
+
+        if op == OP_RANGE:
+            pairs = [PAIR.pack(node.key, node.value) for node in _iter_range(self.tree.root, key, argument)]
+            return RESPONSE.pack(request_id, STATUS_OK, len(pairs)) + b"".join(pairs)
+
+        return RESPONSE.pack(request_id, STATUS_ERROR, 0)
+
+    async def handle(self, reader, writer):
+        """Atende uma conexão: lê blocos, executa os lotes e responde em uma escrita"""
+        buffer = bytearray()
+
+        try:
+            while True:
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+
+                buffer += data
+                complete = len(buffer) - len(buffer) % REQUEST.size
+                if not complete:
+                    continue
+
+                responses = [self.execute(*fields) for fields in REQUEST.iter_unpack(bytes(buffer[:complete]))]
+                del buffer[:complete]
+
+                self.requests += len(responses)
+                self.batches += 1
+                writer.write(b"".join(responses))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, address):
+        """Começa a escutar em (host, porta) via TCP ou em um caminho de socket Unix"""
+        if isinstance(address, str):
+            return await asyncio.start_unix_server(self.handle, path=address)
+
+        host, port = address
+        return await asyncio.start_server(self.handle, host, port)
+
+class _Connection:
+    """Conexão do cliente: envia sem esperar e casa as respostas pelo id"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        # Erro que encerrou a conexão; a partir dele novas requisições falham na hora
+        self.error = None
+        self.receiver = asyncio.ensure_future(self._receive())
+
+    async def _receive(self):
+        """Lê respostas continuamente e resolve o future de cada id"""
+        try:
+            while True:
+                request_id, status, count = RESPONSE.unpack(await self.reader.readexactly(RESPONSE.size))
+                payload = await self.reader.readexactly(count * PAIR.size) if count else b""
+                future = self.pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((status, list(PAIR.iter_unpack(payload))))
+        except (asyncio.IncompleteReadError, ConnectionError) as error:
+            self._fail(ConnectionError(f"Conexão encerrada: {error}"))
+
+    def _fail(self, error):
+        """Marca a conexão como encerrada e falha as requisições pendentes"""
+        self.error = error
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    async def request(self, request_id, op, key, argument):
+        """Envia uma requisição e espera a resposta correspondente"""
+        if self.error is not None:
+            raise self.error
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        self.writer.write(REQUEST.pack(request_id, op, key, argument))
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        self.receiver.cancel()
+        self._fail(ConnectionError("Conexão fechada"))
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+class IndexClient:
+    """
+    Cliente com um pool de conexões usadas em rodízio; cada conexão aceita
+    várias requisições em andamento (pipelining), então muitas tarefas podem
+    compartilhar o mesmo cliente
+    """
+
+    def __init__(self, address, pool_size=4):
+        self.address = address
+        self.pool_size = pool_size
+        self._pool = []
+        self._next_id = 0
+
+    async def connect(self):
+        """Abre as conexões do pool"""
+        for _ in range(self.pool_size):
+            if isinstance(self.address, str):
+                reader, writer = await asyncio.open_unix_connection(self.address)
+            else:
+                reader, writer = await asyncio.open_connection(*self.address)
+            self._pool.append(_Connection(reader, writer))
+        return self
+
+    async def close(self):
+        """Fecha todas as conexões do pool"""
+        for connection in self._pool:
+            await connection.close()
+        self._pool = []
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, op, key, argument=0):
+        """Escolhe a próxima conexão do rodízio e envia a requisição"""
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        connection = self._pool[request_id % len(self._pool)]
+
+        status, pairs = await connection.request(request_id, op, key, argument)
+        if status == STATUS_ERROR:
+            raise RuntimeError(f"Operação {op} rejeitada pelo servidor")
+        return status, pairs
+
+    async def get(self, key):
+        """Valor da chave ou None se ela não existe"""
+        status, pairs = await self._request(OP_GET, key)
+        return pairs[0][1] if status == STATUS_OK else None
+
+    async def put(self, key, value):
+        """Insere ou atualiza o valor de uma chave"""
+        await self._request(OP_PUT, key, value)
+
+    async def delete(self, key):
+        """Remove a chave; retorna False se ela não existia"""
+        status, _ = await self._request(OP_DELETE, key)
+        return status == STATUS_OK
+
+    async def range(self, low, high):
+        """Pares (chave, valor) com low <= chave <= high, em ordem"""
+        _, pairs = await self._request(OP_RANGE, low, high)
+        return pairs
+
+def _serve(structure, address, ready):
+    """Processo do servidor: escuta no endereço e informa por ready onde está"""
+    async def run():
+        server = await IndexServer(structure).start(address)
+        ready.put(address if isinstance(address, str) else server.sockets[0].getsockname()[:2])
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+def start_server_process(structure="Treap", address=("127.0.0.1", 0)):
+    """
+    Sobe o servidor em outro processo (porta 0 escolhe uma livre).
+    Retorna (processo, endereço real) para os clientes.
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(structure, address, ready), daemon=True)
+    process.start()
+    return process, ready.get(timeout=30)
+
+async def _load(address, keys, requests, concurrency, pool_size, seed):
+    """Gera carga com concurrency tarefas; retorna (vazão em req/s, latências em ns)"""
+    rng = random.Random(seed)
+    operations = []
+    for _ in range(requests):
+        roll = rng.random()
+        key = rng.randrange(keys)
+        # 80% GET, 15% PUT, 5% RANGE de 10 chaves
+        if roll < 0.8:
+            operations.append((OP_GET, key, 0))
+        elif roll < 0.95:
+            operations.append((OP_PUT, key, key))
+        else:
+            operations.append((OP_RANGE, key, key + 9))
+
+    latencies = []
+    async with IndexClient(address, pool_size) as client:
+        pending = iter(operations)
+
+        async def worker():
+            for op, key, argument in pending:
+                start = time.perf_counter_ns()
+                await client._request(op, key, argument)
+                latencies.append(time.perf_counter_ns() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return requests / elapsed, latencies
+
+async def _preload(address, keys, pool_size):
+    """Insere as chaves 0..keys-1 antes da medição (em paralelo, com pipelining)"""
+    async with IndexClient(address, pool_size) as client:
+        shuffled = list(range(keys))
+        random.shuffle(shuffled)
+        for start in range(0, keys, 1000):
+            await asyncio.gather(*(client.put(key, key) for key in shuffled[start:start + 1000]))
+
+def benchmark_load(structure="Treap", keys=20000, requests=20000, concurrency=(1, 16, 128),
+                   pool_size=4, address=("127.0.0.1", 0), seed=42):
+    """
+    Sobe o servidor em outro processo (loopback TCP por padrão, ou socket Unix)
+    e mede vazão e p99 de latência para níveis crescentes de requisições em andamento.
+    """
+    process, address = start_server_process(structure, address)
+
+    try:
+        asyncio.run(_preload(address, keys, pool_size))
+
+        print(f"=== Carga no servidor ({structure}, {keys} chaves, {requests} requisições) ===")
+        print(f"{'Concorrência':<14} {'Vazão (req/s)':<16} {'p50 (µs)':<12} {'p99 (µs)':<12}")
+        print("-" * 56)
+
+        for level in concurrency:
+            throughput, latencies = asyncio.run(_load(address, keys, requests, level, pool_size, seed))
+            print(f"{level:<14} {throughput:<16.0f} {percentile(latencies, 0.5) / 1000:<12.1f} "
+                  f"{percentile(latencies, 0.99) / 1000:<12.1f}")
+    finally:
+        process.terminate()
+        process.join()
+
+async def _demo(address):
+    """Operações básicas através do cliente"""
+    async with IndexClient(address, pool_size=2) as client:
+        elements = [10, 5, 15, 3, 7, 12, 18, 1, 4, 6, 8]
+        await asyncio.gather(*(client.put(key, key * 100) for key in elements))
+        print("Inserindo elementos:", elements)
+        print(f"get(7) = {await client.get(7)}, get(20) = {await client.get(20)}")
+        print(f"range(4, 12) = {await client.range(4, 12)}")
+        print(f"delete(7) = {await client.delete(7)}, delete(7) = {await client.delete(7)}")
+        print(f"range(4, 12) = {await client.range(4, 12)}\n")
+
+def main():
+    """Demonstração (padrão), servidor dedicado (serve) ou benchmark de carga (bench)"""
+    parser = argparse.ArgumentParser(description="Servidor chave-valor sobre Treap/AVLTree")
+    parser.add_argument("mode", nargs="?", choices=("demo", "serve", "bench"), default="demo")
+    parser.add_argument("--structure", choices=tuple(STRUCTURES), default="Treap")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--unix", help="caminho de socket Unix (no lugar de TCP)")
+    args = parser.parse_args()
+
+    address = args.unix or (args.host, args.port)
+
+    if args.mode == "serve":
+        async def serve():
+            server = await IndexServer(args.structure).start(address)
+            print(f"Servindo {args.structure} em {address if args.unix else server.sockets[0].getsockname()[:2]}")
+            await server.serve_forever()
+        asyncio.run(serve())
+    elif args.mode == "bench":
+        benchmark_load(args.structure, address=address)
+    else:
+        print("=== Demonstração do servidor de índice ===\n")
+        process, real_address = start_server_process(args.structure, address)
+        try:
+            asyncio.run(_demo(real_address))
+        finally:
+            process.terminate()
+            process.join()
+        benchmark_load(args.structure, address=address)
+
+if __name__ == "__main__":
+    main()
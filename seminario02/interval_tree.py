@@ -0,0 +1,204 @@
+# Implementação de uma árvore de intervalos sobre a árvore AVL
+# Autor: Matheus Cerqueira de Jesus
+import random
+import time
+
+from avl_tree import AVLNode, AVLTree
+
+class IntervalNode(AVLNode):
+    """Nó da árvore de intervalos: chave (início, fim) e maior fim da subárvore"""
+    def __init__(self, key):
+        super().__init__(key)
+        self.max_end = key[1]
+
+    def __str__(self):
+        return f"({self.key}, h={self.height}, max={self.max_end})"
+
+class IntervalTree(AVLTree):
+    """
+    Árvore de intervalos fechados [início, fim] (aumento da árvore AVL)
+    - chaves são tuplas (início, fim), ordenadas pelo início (e depois pelo fim)
+    - cada nó guarda max_end, o maior fim da sua subárvore; ele é recalculado em
+      _update_height, que a AVL já chama em cada nó do caminho de inserção e remoção
+      e nos dois nós de cada rotação, então o aumento nunca fica desatualizado
+    - overlaps(ponto) e overlaps(início, fim) geram os intervalos que se sobrepõem,
+      descendo apenas em subárvores que ainda podem conter algum
+    """
+
+    node_class = IntervalNode
+
+    def _update_height(self, node):
+        """Atualiza a altura e o maior fim do nó a partir dos filhos"""
+        if node is not None:
+            super()._update_height(node)
+            max_end = node.key[1]
+            if node.left is not None and node.left.max_end > max_end:
+                max_end = node.left.max_end
+            if node.right is not None and node.right.max_end > max_end:
+                max_end = node.right.max_end
+            node.max_end = max_end
+
+    def insert(self, key):
+        """Insere o intervalo key = (início, fim)"""
+        if key[0] > key[1]:
+            raise ValueError(f"Intervalo inválido: {key}")
+        super().insert(key)
+
+    @classmethod
+    def from_intervals(cls, intervals, **options):
+        """
+        Construção em lote: ordena os intervalos (sem repetidos) e monta uma
+        árvore perfeitamente balanceada em O(n) a partir da lista ordenada
+        """
+        keys = sorted(set(intervals))
+        for key in keys:
+            if key[0] > key[1]:
+                raise ValueError(f"Intervalo inválido: {key}")
+
+        tree = cls(**options)
+        tree.root = tree._build_balanced(keys, 0, len(keys))
+        if tree.filter is not None:
+            tree.filter.rebuild()
+        return tree
+
+    def _build_balanced(self, keys, start, stop):
+        """Subárvore com keys[start:stop]; o elemento do meio vira a raiz"""
+        if start >= stop:
+            return None
+
+        middle = (start + stop) // 2
+        node = self.node_class(keys[middle])
+        node.left = self._build_balanced(keys, start, middle)
+        node.right = self._build_balanced(keys, middle + 1, stop)
+        self._update_height(node)
+        return node
+
+    def overlaps(self, low, high=None):
+        """
+        Gera os intervalos que se sobrepõem ao ponto low ou a [low, high],
+        em ordem de início, com pilha explícita:
+        - a subárvore esquerda só é visitada se seu max_end alcança low
+        - a direita só se o início do nó não passou de high (à direita só há inícios maiores)
+        """
+        if high is None:
+            high = low
+
+        stack = []
+        node = self.root
+
+        while stack or node is not None:
+            while node is not None and node.max_end >= low:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+
+            start, end = node.key
+            if start > high:
+                # Este nó e tudo que falta visitar começam depois de high
+                return
+            if end >= low:
+                yield node.key
+            node = node.right
+
+    def validate(self):
+        """Além das propriedades AVL, confere max_end em todos os nós"""
+        if not super().validate():
+            return False
+
+        for node in self._iter_nodes():
+            expected = max([node.key[1]] + [child.max_end for child in (node.left, node.right) if child is not None])
+            if node.max_end != expected:
+                return False
+
+        return True
+
+def brute_force_overlaps(intervals, low, high=None):
+    """Varredura completa: todos os intervalos que se sobrepõem a [low, high]"""
+    if high is None:
+        high = low
+    return [interval for interval in intervals if interval[0] <= high and interval[1] >= low]
+
+def _random_intervals(n, span=10**6, max_length=1000, seed=42):
+    """n intervalos aleatórios distintos dentro de [0, span)"""
+    rng = random.Random(seed)
+    intervals = set()
+    while len(intervals) < n:
+        start = rng.randrange(span)
+        intervals.add((start, start + rng.randrange(max_length)))
+    return list(intervals)
+
+def _random_queries(count, span=10**6, max_length=1000, seed=7):
+    """Consultas aleatórias (início, fim) dentro de [0, span)"""
+    rng = random.Random(seed)
+    return [(start, start + rng.randrange(max_length)) for start in (rng.randrange(span) for _ in range(count))]
+
+def benchmark_overlaps(sizes=(1000, 10000, 100000), queries=200):
+    """Compara consultas de sobreposição na árvore com a varredura completa"""
+    print(f"=== Sobreposição: IntervalTree vs varredura ({queries} consultas) ===")
+    print(f"{'n':<10} {'Construção (s)':<16} {'Árvore (s)':<12} {'Varredura (s)':<14} {'Iguais':<8}")
+    print("-" * 62)
+
+    for n in sizes:
+        intervals = _random_intervals(n)
+        windows = _random_queries(queries)
+
+        start = time.perf_counter()
+        tree = IntervalTree.from_intervals(intervals)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree_results = [list(tree.overlaps(low, high)) for low, high in windows]
+        tree_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scan_results = [brute_force_overlaps(intervals, low, high) for low, high in windows]
+        scan_time = time.perf_counter() - start
+
+        same = all(found == sorted(expected) for found, expected in zip(tree_results, scan_results))
+        print(f"{n:<10} {build_time:<16.6f} {tree_time:<12.6f} {scan_time:<14.6f} {str(same):<8}")
+
+def _bench_overlaps(method):
+    """Factory para o bench.py: 200 consultas sobre n intervalos"""
+    def bench(n):
+        intervals = _random_intervals(n)
+        windows = _random_queries(200)
+        if method == "scan":
+            return lambda: [brute_force_overlaps(intervals, low, high) for low, high in windows]
+
+        tree = IntervalTree.from_intervals(intervals)
+        return lambda: [list(tree.overlaps(low, high)) for low, high in windows]
+    return bench
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    "IntervalTree/overlaps": (_bench_overlaps("tree"), (10000, 100000)),
+    "brute_force/overlaps": (_bench_overlaps("scan"), (10000, 100000)),
+}
+
+def main():
+    """Função de demonstração da árvore de intervalos"""
+    print("=== Demonstração da Árvore de Intervalos ===\n")
+
+    tree = IntervalTree()
+    intervals = [(15, 20), (10, 30), (17, 19), (5, 20), (12, 15), (30, 40)]
+    print("Inserindo intervalos:", intervals)
+    for interval in intervals:
+        tree.insert(interval)
+
+    print(f"Árvore válida (AVL + max_end): {tree.validate()}")
+    print("\nEstrutura da árvore:")
+    tree.print_tree()
+
+    print(f"\nSobrepõem o ponto 18: {list(tree.overlaps(18))}")
+    print(f"Sobrepõem [21, 31]: {list(tree.overlaps(21, 31))}")
+
+    tree.delete((10, 30))
+    print(f"\nApós remover (10, 30), sobrepõem [21, 31]: {list(tree.overlaps(21, 31))}")
+    print(f"Árvore válida (AVL + max_end): {tree.validate()}\n")
+
+    benchmark_overlaps()
+
+if __name__ == "__main__":
+    main()
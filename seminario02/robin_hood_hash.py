@@ -0,0 +1,409 @@
+# Tabelas hash com latência de cauda previsível: Robin Hood e grupos de bytes de controle (SwissTable)
+# Autor: Matheus Cerqueira de Jesus
+# - Robin Hood: na colisão, a chave mais distante da sua posição ideal fica com a posição
+# - SwissTable: um byte de controle por posição (7 bits do hash), comparado em grupos de 16 com NumPy
+# Ambas registram histograma de sondagens, fator de carga e número de redimensionamentos.
+
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from hash_table import OpenAddressingHashTable
+from tree_stats import percentile
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+
+def mix_hash(key):
+    """Hash de 64 bits bem espalhado (multiplicação de Knuth + xor dos bits altos)"""
+    h = (hash(key) * _GOLDEN_64) & _MASK_64
+    return h ^ (h >> 32)
+
+class RobinHoodHashTable:
+    """
+    Endereçamento aberto com sondagem linear e deslocamento Robin Hood
+    - Cada posição guarda a distância da chave até sua posição ideal
+    - Na inserção, quem está mais perto de casa cede a posição
+    - Remoção por deslocamento para trás (sem lápides)
+    """
+    
+    def __init__(self, size=8, max_load_factor=0.9):
+        # Com fator 1 a tabela pode encher e a sondagem não acha posição livre
+        if not 0 < max_load_factor < 1:
+            raise ValueError(f"Fator de carga deve estar em (0, 1): {max_load_factor}")
+        
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        
+        self.keys = [None] * capacity
+        self.distances = [0] * capacity
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self.resize_count = 0
+        self.probe_histogram = Counter()
+    
+    def load_factor(self):
+        """Retorna o fator de carga (chaves / posições)"""
+        return self.count / len(self.keys)
+    
+    def _resize(self, new_size):
+        """Reinsere todas as chaves em um vetor maior"""
+        old_keys = self.keys
+        self.keys = [None] * new_size
+        self.distances = [0] * new_size
+        self.count = 0
+        self.resize_count += 1
+        
+        for key in old_keys:
+            if key is not None:
+                self._place(key)
+    
+    def _place(self, key):
+        """Coloca uma chave que não está na tabela, deslocando as mais próximas de casa"""
+        keys = self.keys
+        distances = self.distances
+        mask = len(keys) - 1
+        index = mix_hash(key) & mask
+        distance = 0
+        
+        while True:
+            current = keys[index]
+            if current is None:
+                keys[index] = key
+                distances[index] = distance
+                self.count += 1
+                return
+            
+            # Robin Hood: a chave residente está mais perto de casa, troca
+            if distances[index] < distance:
+                keys[index], key = key, current
+                distances[index], distance = distance, distances[index]
+            
+            index = (index + 1) & mask
+            distance += 1
+    
+    def _find(self, key):
+        """Retorna (posição da chave ou None, número de sondagens)"""
+        keys = self.keys
+        distances = self.distances
+        mask = len(keys) - 1
+        index = mix_hash(key) & mask
+        distance = 0
+        
+        while True:
+            current = keys[index]
+            # Parada antecipada: a chave estaria antes de alguém mais perto de casa
+            if current is None or distances[index] < distance:
+                return None, distance + 1
+            if current == key:
+                return index, distance + 1
+            
+            index = (index + 1) & mask
+            distance += 1
+    
+    def insert(self, key):
+        """Insere uma chave (chaves duplicadas não são permitidas)"""
+        if self._find(key)[0] is not None:
+            return
+        
+        if self.count + 1 > self.max_load_factor * len(self.keys):
+            self._resize(2 * len(self.keys))
+        self._place(key)
+    
+    def search(self, key):
+        """Busca uma chave, registrando o número de sondagens"""
+        index, probes = self._find(key)
+        self.probe_histogram[probes] += 1
+        return index is not None
+    
+    def delete(self, key):
+        """Remove uma chave deslocando as seguintes uma posição para trás"""
+        index, _ = self._find(key)
+        if index is None:
+            return
+        
+        keys = self.keys
+        distances = self.distances
+        mask = len(keys) - 1
+        following = (index + 1) & mask
+        
+        while keys[following] is not None and distances[following] > 0:
+            keys[index] = keys[following]
+            distances[index] = distances[following] - 1
+            index = following
+            following = (following + 1) & mask
+        
+        keys[index] = None
+        distances[index] = 0
+        self.count -= 1
+    
+    def probe_length(self, key):
+        """Número de posições visitadas pela busca da chave"""
+        return self._find(key)[1]
+    
+    def size(self):
+        """Número de chaves na tabela"""
+        return self.count
+    
+    def is_empty(self):
+        """Verifica se a tabela está vazia"""
+        return self.count == 0
+    
+    def metrics(self):
+        """Métricas da tabela em um dicionário"""
+        return {
+            "load_factor": self.load_factor(),
+            "resize_count": self.resize_count,
+            "probe_histogram": dict(sorted(self.probe_histogram.items())),
+            "displacement_histogram": dict(sorted(Counter(
+                d for key, d in zip(self.keys, self.distances) if key is not None).items())),
+        }
+
+# Bytes de controle: bit alto ligado = posição livre; senão guarda os 7 bits baixos do hash
+_EMPTY = 0x80
+_DELETED = 0xFE
+_GROUP = 16
+
+class SwissHashTable:
+    """
+    Tabela hash no estilo SwissTable
+    - Vetor de bytes de controle (NumPy uint8) separado do vetor de chaves
+    - A busca compara os 16 bytes de um grupo de uma vez (np.flatnonzero)
+      e só olha as chaves cujo byte de controle coincide
+    - Grupos sondados em sequência triangular; remoção com lápide
+    """
+    
+    def __init__(self, size=16, max_load_factor=0.875):
+        # Com fator 1 a tabela pode encher e a sondagem não acha posição livre
+        if not 0 < max_load_factor < 1:
+            raise ValueError(f"Fator de carga deve estar em (0, 1): {max_load_factor}")
+        
+        capacity = _GROUP
+        while capacity < size:
+            capacity *= 2
+        
+        self.control = np.full(capacity, _EMPTY, dtype=np.uint8)
+        self.keys = [None] * capacity
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self.tombstones = 0
+        self.resize_count = 0
+        self.probe_histogram = Counter()
+    
+    def load_factor(self):
+        """Retorna o fator de carga (chaves / posições)"""
+        return self.count / len(self.keys)
+    
+    def _find(self, key, h):
+        """Retorna (posição da chave ou None, número de grupos sondados)"""
+        control = self.control
+        groups = len(self.keys) // _GROUP
+        group = (h >> 7) & (groups - 1)
+        tag = h & 0x7F
+        
+        for step in range(1, groups + 1):
+            start = group * _GROUP
+            window = control[start:start + _GROUP]
+            
+            for offset in np.flatnonzero(window == tag):
+                if self.keys[start + offset] == key:
+                    return start + int(offset), step
+            
+            # Um grupo com posição vazia encerra a busca
+            if (window == _EMPTY).any():
+                return None, step
+            
+            group = (group + step) & (groups - 1)
+        
+        return None, groups
+    
+    def _free_slot(self, h):
+        """Primeira posição vazia ou lápide na sequência de sondagem"""
+        control = self.control
+        groups = len(self.keys) // _GROUP
+        group = (h >> 7) & (groups - 1)
+        
+        for step in range(1, groups + 1):
+            start = group * _GROUP
+            free = np.flatnonzero(control[start:start + _GROUP] & 0x80)
+            if len(free):
+                return start + int(free[0])
+            group = (group + step) & (groups - 1)
+        
+        return None
+    
+    def _resize(self, new_size):
+        """Reconstrói a tabela, descartando as lápides"""
+        old_keys = self.keys
+        old_control = self.control
+        self.control = np.full(new_size, _EMPTY, dtype=np.uint8)
+        self.keys = [None] * new_size
+        self.count = 0
+        self.tombstones = 0
+        self.resize_count += 1
+        
+        for index in np.flatnonzero(old_control < _EMPTY):
+            key = old_keys[index]
+            h = mix_hash(key)
+            slot = self._free_slot(h)
+            self.control[slot] = h & 0x7F
+            self.keys[slot] = key
+            self.count += 1
+    
+    def insert(self, key):
+        """Insere uma chave (chaves duplicadas não são permitidas)"""
+        h = mix_hash(key)
+        if self._find(key, h)[0] is not None:
+            return
+        
+        if self.count + self.tombstones + 1 > self.max_load_factor * len(self.keys):
+            # Só cresce se as chaves ocupam a tabela; senão apenas limpa as lápides
+            grow = self.count + 1 > self.max_load_factor * len(self.keys) / 2
+            self._resize(2 * len(self.keys) if grow else len(self.keys))
+        
+        slot = self._free_slot(h)
+        if self.control[slot] == _DELETED:
+            self.tombstones -= 1
+        self.control[slot] = h & 0x7F
+        self.keys[slot] = key
+        self.count += 1
+    
+    def search(self, key):
+        """Busca uma chave, registrando o número de grupos sondados"""
+        index, probes = self._find(key, mix_hash(key))
+        self.probe_histogram[probes] += 1
+        return index is not None
+    
+    def delete(self, key):
+        """Remove uma chave deixando uma lápide"""
+        index, _ = self._find(key, mix_hash(key))
+        if index is not None:
+            self.control[index] = _DELETED
+            self.keys[index] = None
+            self.count -= 1
+            self.tombstones += 1
+    
+    def probe_length(self, key):
+        """Número de grupos visitados pela busca da chave"""
+        return self._find(key, mix_hash(key))[1]
+    
+    def size(self):
+        """Número de chaves na tabela"""
+        return self.count
+    
+    def is_empty(self):
+        """Verifica se a tabela está vazia"""
+        return self.count == 0
+    
+    def metrics(self):
+        """Métricas da tabela em um dicionário"""
+        return {
+            "load_factor": self.load_factor(),
+            "resize_count": self.resize_count,
+            "tombstones": self.tombstones,
+            "probe_histogram": dict(sorted(self.probe_histogram.items())),
+        }
+
+# Tabelas comparadas com carga alta: nome -> construtor para uma capacidade (sem redimensionar)
+_HIGH_LOAD_TABLES = {
+    "Linear (base)": lambda capacity: OpenAddressingHashTable(capacity, probing="linear", max_load_factor=0.99),
+    "Robin Hood": lambda capacity: RobinHoodHashTable(capacity, max_load_factor=0.99),
+    "SwissTable": lambda capacity: SwissHashTable(capacity, max_load_factor=0.99),
+}
+
+def _high_load_keys(capacity, load, lookups, seed):
+    """Chaves que enchem capacity até load e buscas embaralhadas (metade ausentes)"""
+    rng = random.Random(seed)
+    n = int(capacity * load)
+    keys = rng.sample(range(1 << 40), n + lookups)
+    present, absent = keys[:n], keys[n:]
+    queries = rng.sample(present, lookups // 2) + absent[:lookups // 2]
+    rng.shuffle(queries)
+    return present, queries
+
+def _probe_stats(table, queries):
+    """Comprimento de sondagem das buscas: média, p99 e máximo"""
+    probes = [table.probe_length(key) for key in queries]
+    return {"probe_mean": sum(probes) / len(probes), "probe_p99": percentile(probes, 0.99),
+            "probe_max": max(probes)}
+
+def benchmark_high_load(capacity=1 << 15, load=0.9, lookups=20000, seed=42):
+    """
+    Enche cada tabela até o fator de carga pedido (sem redimensionar) e mede
+    buscas com e sem sucesso: tempo total, p99 de latência e comprimento de sondagem.
+    """
+    present, queries = _high_load_keys(capacity, load, lookups, seed)
+    tables = {name: make(capacity) for name, make in _HIGH_LOAD_TABLES.items()}
+    
+    print(f"=== Buscas com carga {load:.0%} ({len(present)} chaves, {lookups} buscas) ===")
+    print(f"{'Tabela':<15} {'Total (s)':<12} {'p99 (µs)':<12} {'Sond. média':<12} "
+          f"{'Sond. p99':<10} {'Sond. máx':<10}")
+    print("-" * 75)
+    
+    for name, table in tables.items():
+        for key in present:
+            table.insert(key)
+        
+        latencies = []
+        start_total = time.perf_counter()
+        for key in queries:
+            start = time.perf_counter_ns()
+            table.search(key)
+            latencies.append(time.perf_counter_ns() - start)
+        total = time.perf_counter() - start_total
+        
+        probes = _probe_stats(table, queries)
+        print(f"{name:<15} {total:<12.6f} {percentile(latencies, 0.99) / 1000:<12.2f} "
+              f"{probes['probe_mean']:<12.2f} {probes['probe_p99']:<10} {probes['probe_max']:<10}")
+    
+    return tables
+
+def _bench_high_load(name, load=0.9):
+    """
+    Factory para o bench.py: tabela com n posições (arredondado para potência de 2)
+    cheia até load e uma busca por chave, metade ausentes; sondagens vão nos contadores.
+    """
+    def bench(n):
+        capacity = 1 << max(4, (n - 1).bit_length())
+        present, queries = _high_load_keys(capacity, load, int(capacity * load), seed=42)
+        table = _HIGH_LOAD_TABLES[name](capacity)
+        for key in present:
+            table.insert(key)
+        
+        def run():
+            for key in queries:
+                table.search(key)
+        
+        run.counters = lambda: _probe_stats(table, queries)
+        return run
+    return bench
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    f"{structure}/search_load90": (_bench_high_load(name), (1 << 14, 1 << 16))
+    for name, structure in (("Linear (base)", "OpenAddressingHashTable"),
+                            ("Robin Hood", "RobinHoodHashTable"),
+                            ("SwissTable", "SwissHashTable"))
+}
+
+def main():
+    """Função de demonstração das tabelas Robin Hood e SwissTable"""
+    print("=== Demonstração Robin Hood / SwissTable ===\n")
+    
+    elements = [10, 5, 15, 3, 7, 12, 18, 1, 4, 6, 8]
+    for table in (RobinHoodHashTable(), SwissHashTable()):
+        for elem in elements:
+            table.insert(elem)
+        table.delete(15)
+        found = [key for key in (7, 15, 20) if table.search(key)]
+        print(f"{type(table).__name__:<20} encontrados (7, 15, 20): {found}")
+        print(f"  métricas: {table.metrics()}")
+    
+    print()
+    benchmark_high_load()
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
 # Implementação de uma estrutura de dados Treap (Tree + Heap)
 # Autor: Matheus Cerqueira de Jesus
+import hashlib
 import random
 
+from bloom_filter import MembershipFilter
+from tree_stats import TreeStats
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+
+def splitmix64(x):
+    """Mistura de 64 bits do gerador SplitMix64 (bijeção, bem espalhada)"""
+    x = (x + _GOLDEN_64) & _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
 class TreapNode:
     """Nó da Treap que armazena chave, prioridade e referências para filhos"""
+    # __slots__: nó compacto, sem __dict__ (prioridade inteira ou float guardada direto no nó)
+    __slots__ = ("key", "priority", "left", "right")
+    
     def __init__(self, key, priority=None):
         self.key = key
         self.priority = priority if priority is not None else random.random()
@@ -11,17 +28,58 @@ class TreapNode:
         self.right = None
     
     def __str__(self):
-        return f"({self.key}, {self.priority:.3f})"
+        # Prioridades inteiras de 64 bits são mostradas na escala [0, 1)
+        priority = self.priority / 2**64 if isinstance(self.priority, int) else self.priority
+        return f"({self.key}, {priority:.3f})"
 
 class Treap:
     """
     Implementação de Treap (Tree + Heap)
     - Propriedade BST: chaves seguem ordenação de árvore binária de busca
     - Propriedade Heap: prioridades seguem propriedade de max-heap
+    - instrument=True conta comparações, rotações e profundidades em self.stats;
+      desligado, os métodos originais são usados sem nenhum custo extra
+    - filter_fp_rate liga um filtro de Bloom (self.filter) que responde em O(1)
+      buscas por chaves ausentes; None (padrão) deixa a árvore sem filtro
+    - priorities escolhe a origem das prioridades (reprodutível com seed):
+      "random"     -> gerador próprio random.Random(seed) (global se seed=None)
+      "hash"       -> blake2b de repr((chave, seed)) em 64 bits, sem estado e estável
+                      entre execuções para qualquer chave com repr estável (ex.: str);
+                      é um modo de reprodutibilidade, mais caro por inserção que "random"
+      "splitmix64" -> splitmix64(chave ^ seed), independe da ordem de inserção
+                      e da implementação de hash do Python (chaves inteiras)
+    - node_class define o tipo de nó criado nas inserções, para subclasses que
+      guardam dados extras no nó
     """
     
-    def __init__(self):
+    node_class = TreapNode
+    
+    PRIORITIES = ("random", "hash", "splitmix64")
+    
+    def __init__(self, instrument=False, seed=None, priorities="random", filter_fp_rate=None):
+        if priorities not in self.PRIORITIES:
+            raise ValueError(f"Origem de prioridades inválida: {priorities}")
+        
         self.root = None
+        self.stats = None
+        self.filter = None
+        self.seed = seed
+        self.priorities = priorities
+        
+        if priorities == "random":
+            self._next_priority = random.Random(seed).random if seed is not None else random.random
+        else:
+            self._next_priority = None
+        
+        if instrument:
+            # Versões instrumentadas substituem os métodos apenas nesta instância
+            self.stats = TreeStats()
+            self._insert_recursive = self._insert_instrumented
+            self._search_recursive = self._search_instrumented
+            self._delete_recursive = self._delete_instrumented
+        
+        if filter_fp_rate is not None:
+            self.filter = MembershipFilter(self, filter_fp_rate)
     
     def _rotate_right(self, node):
         """Rotação à direita para manter propriedade do heap"""
@@ -37,15 +95,29 @@ class Treap:
         right_child.left = node
         return right_child
     
+    def _priority_for(self, key):
+        """Prioridade de uma nova chave conforme a origem configurada"""
+        if self._next_priority is not None:
+            return self._next_priority()
+        
+        seed = self.seed or 0
+        if self.priorities == "hash":
+            # hash() de str/bytes muda a cada processo (PYTHONHASHSEED); o blake2b não
+            digest = hashlib.blake2b(repr((key, seed)).encode(), digest_size=8).digest()
+            return int.from_bytes(digest, "little")
+        return splitmix64((key ^ seed) & _MASK_64)
+    
     def insert(self, key, priority=None):
         """Insere uma chave na Treap"""
+        if priority is None:
+            priority = self._priority_for(key)
         self.root = self._insert_recursive(self.root, key, priority)
     
     def _insert_recursive(self, node, key, priority):
         """Inserção recursiva mantendo propriedades BST e Heap"""
         # Caso base: inserir novo nó
         if node is None:
-            return TreapNode(key, priority)
+            return self.node_class(key, priority)
         
         # Inserção seguindo propriedade BST
         if key < node.key:
@@ -108,56 +180,170 @@ class Treap:
         
         return node
     
+    def _insert_instrumented(self, node, key, priority, depth=1):
+        """Inserção recursiva contando comparações, rotações e profundidade"""
+        stats = self.stats
+        
+        if node is None:
+            stats.insert_depths[depth] += 1
+            return self.node_class(key, priority)
+        
+        stats.comparisons += 1
+        if key < node.key:
+            node.left = self._insert_instrumented(node.left, key, priority, depth + 1)
+            if node.left.priority > node.priority:
+                stats.rotations["right"] += 1
+                node = self._rotate_right(node)
+        else:
+            stats.comparisons += 1
+            if key > node.key:
+                node.right = self._insert_instrumented(node.right, key, priority, depth + 1)
+                if node.right.priority > node.priority:
+                    stats.rotations["left"] += 1
+                    node = self._rotate_left(node)
+        
+        return node
+    
+    def _search_instrumented(self, node, key):
+        """Busca contando comparações e nós visitados"""
+        stats = self.stats
+        visited = 0
+        
+        while node is not None:
+            visited += 1
+            stats.comparisons += 1
+            if key == node.key:
+                stats.record_search(visited)
+                return True
+            stats.comparisons += 1
+            node = node.left if key < node.key else node.right
+        
+        stats.record_search(visited)
+        return False
+    
+    def _delete_instrumented(self, node, key):
+        """Remoção recursiva contando comparações e rotações"""
+        stats = self.stats
+        
+        if node is None:
+            return None
+        
+        stats.comparisons += 1
+        if key < node.key:
+            node.left = self._delete_instrumented(node.left, key)
+            return node
+        
+        stats.comparisons += 1
+        if key > node.key:
+            node.right = self._delete_instrumented(node.right, key)
+            return node
+        
+        if node.left is None:
+            return node.right
+        elif node.right is None:
+            return node.left
+        
+        if node.left.priority > node.right.priority:
+            stats.rotations["right"] += 1
+            node = self._rotate_right(node)
+            node.right = self._delete_instrumented(node.right, key)
+        else:
+            stats.rotations["left"] += 1
+            node = self._rotate_left(node)
+            node.left = self._delete_instrumented(node.left, key)
+        
+        return node
+    
+    def iter_inorder(self):
+        """Percurso em ordem iterativo com pilha explícita (gera as chaves sob demanda)"""
+        stack = []
+        node = self.root
+        
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+    
+    def iter_preorder(self):
+        """Percurso em pré-ordem iterativo, gera pares (chave, prioridade)"""
+        stack = [self.root] if self.root is not None else []
+        
+        while stack:
+            node = stack.pop()
+            yield (node.key, node.priority)
+            # Direita empilhada antes para a esquerda sair primeiro
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+    
+    def _iter_nodes(self):
+        """Gera todos os nós (ordem qualquer), sem recursão"""
+        stack = [self.root] if self.root is not None else []
+        
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+    
     def inorder_traversal(self):
         """Percurso em ordem (retorna chaves ordenadas)"""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-    
-    def _inorder_recursive(self, node, result):
-        """Percurso em ordem recursivo"""
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_recursive(node.right, result)
+        return list(self.iter_inorder())
     
     def preorder_traversal(self):
         """Percurso em pré-ordem (mostra estrutura da árvore)"""
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
-    
-    def _preorder_recursive(self, node, result):
-        """Percurso em pré-ordem recursivo"""
-        if node is not None:
-            result.append((node.key, node.priority))
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        return list(self.iter_preorder())
     
     def is_empty(self):
         """Verifica se a Treap está vazia"""
         return self.root is None
     
     def height(self):
-        """Calcula a altura da Treap"""
-        return self._height_recursive(self.root)
-    
-    def _height_recursive(self, node):
-        """Cálculo recursivo da altura"""
-        if node is None:
-            return 0
-        return 1 + max(self._height_recursive(node.left), 
-                      self._height_recursive(node.right))
+        """Calcula a altura da Treap percorrendo nível a nível (sem recursão)"""
+        height = 0
+        level = [self.root] if self.root is not None else []
+        
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        
+        return height
     
     def size(self):
         """Conta o número de nós na Treap"""
-        return self._size_recursive(self.root)
+        return sum(1 for _ in self._iter_nodes())
     
-    def _size_recursive(self, node):
-        """Contagem recursiva de nós"""
-        if node is None:
-            return 0
-        return 1 + self._size_recursive(node.left) + self._size_recursive(node.right)
+    def validate(self):
+        """
+        Verifica em uma única passada O(n), sem recursão:
+        - ordem BST (cada nó dentro dos limites herdados dos ancestrais)
+        - propriedade de max-heap das prioridades
+        As verificações são locais a cada nó, então valem em qualquer ordem de visita.
+        """
+        stack = [(self.root, None, None)] if self.root is not None else []
+        
+        while stack:
+            node, low, high = stack.pop()
+            
+            if (low is not None and not low < node.key) or (high is not None and not node.key < high):
+                return False
+            
+            for child in (node.left, node.right):
+                if child is not None and child.priority > node.priority:
+                    return False
+            
+            if node.left is not None:
+                stack.append((node.left, low, node.key))
+            if node.right is not None:
+                stack.append((node.right, node.key, high))
+        
+        return True
     
     def print_tree(self, node=None, level=0, prefix="Root: "):
         """Imprime a estrutura da árvore de forma visual"""
@@ -191,6 +377,7 @@ def main():
     
     print(f"\nTamanho da Treap: {treap.size()}")
     print(f"Altura da Treap: {treap.height()}")
+    print(f"Treap válida (BST + heap): {treap.validate()}")
     
     # Mostrar estrutura da árvore
     print("\nEstrutura da árvore:")
@@ -204,6 +391,14 @@ def main():
     for key, priority in treap.preorder_traversal():
         print(f"  {key}: {priority:.3f}")
     
+    # Prioridades reprodutíveis: mesma seed, mesma forma de árvore
+    print("\nTreaps com seed=42 (forma idêntica a cada execução):")
+    for priorities in Treap.PRIORITIES:
+        seeded = Treap(seed=42, priorities=priorities)
+        for elem in elements:
+            seeded.insert(elem)
+        print(f"  {priorities:<11} altura={seeded.height()} raiz={seeded.root}")
+    
     # Testar busca
     print("\n=== Testes de Busca ===")
     test_keys = [7, 20, 1, 25, 15]
@@ -0,0 +1,50 @@
+# Contadores de operações para instrumentar as árvores (AVLTree e Treap)
+# e o percentil usado nos relatórios de latência dos benchmarks
+# Autor: Matheus Cerqueira de Jesus
+
+from collections import Counter
+
+def percentile(values, fraction):
+    """Percentil de uma lista (ordena uma cópia)"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class TreeStats:
+    """
+    Contadores de uma árvore instrumentada
+    - comparisons: comparações de chaves no caminho das operações
+    - rotations: rotações por caso (LL/LR/RR/RL na AVL, left/right na Treap)
+    - nodes_visited / searches: nós visitados por busca
+    - histogramas da profundidade em que buscas terminam e inserções acontecem
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Zera todos os contadores"""
+        self.comparisons = 0
+        self.rotations = Counter()
+        self.searches = 0
+        self.nodes_visited = 0
+        self.search_depths = Counter()
+        self.insert_depths = Counter()
+    
+    def record_search(self, visited):
+        """Registra uma busca que visitou `visited` nós"""
+        self.searches += 1
+        self.nodes_visited += visited
+        self.search_depths[visited] += 1
+    
+    def as_dict(self):
+        """Exporta os contadores como dicionário (para relatórios e JSON)"""
+        return {
+            "comparisons": self.comparisons,
+            "rotations": dict(self.rotations),
+            "total_rotations": sum(self.rotations.values()),
+            "searches": self.searches,
+            "nodes_visited": self.nodes_visited,
+            "nodes_per_search": self.nodes_visited / self.searches if self.searches else 0.0,
+            "search_depth_histogram": dict(sorted(self.search_depths.items())),
+            "insert_depth_histogram": dict(sorted(self.insert_depths.items())),
+        }
@@ -0,0 +1,355 @@
+# Durabilidade para os índices em árvore: write-ahead log (WAL) e checkpoints
+# Autor: Matheus Cerqueira de Jesus
+#
+# Cada insert/delete é gravado no log antes de ser aplicado na árvore. Registros
+# são acumulados e gravados em grupo (group commit); a política de fsync diz
+# quando o grupo é forçado para o disco. Um checkpoint grava as chaves da árvore
+# em ordem e zera o log; a recuperação carrega o checkpoint e reaplica o log.
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from avl_tree import AVLTree
+from treap import Treap
+
+# Registro do log: (operação, chave) seguido do CRC32 desses 9 bytes
+RECORD = struct.Struct("!Bq")
+CRC = struct.Struct("!I")
+RECORD_SIZE = RECORD.size + CRC.size
+
+OP_INSERT, OP_DELETE = 1, 2
+
+# Checkpoint: MAGIC, quantidade de chaves, chaves "!q" em ordem e CRC32 das chaves
+CHECKPOINT_MAGIC = b"CKP1"
+CHECKPOINT_HEADER = struct.Struct("!4sQ")
+
+STRUCTURES = {
+    "Treap": Treap,
+    "AVLTree": AVLTree,
+}
+
+class WriteAheadLog:
+    """
+    Log somente-acréscimo de operações com group commit
+    - os registros ficam em memória até formar um grupo de group_size registros
+      (ou até group_interval segundos desde o primeiro pendente) e são gravados
+      com uma única escrita; o prazo é vigiado por uma thread própria, então um
+      grupo incompleto é gravado mesmo que não chegue mais nenhum registro
+    - janela de durabilidade: um registro aceito por append só está seguro depois
+      do commit do seu grupo; uma queda antes disso perde no máximo group_size
+      registros ou group_interval segundos de escritas (commit() força na hora)
+    - fsync escolhe o que acontece com cada grupo gravado:
+      "always" -> um grupo por registro, com fsync (nada se perde)
+      "group"  -> fsync a cada grupo (perde no máximo o grupo pendente)
+      "never"  -> só escreve, o sistema operacional decide quando ir ao disco
+    - fsyncs conta as chamadas de fsync, para comparar as políticas
+    """
+
+    FSYNC_POLICIES = ("always", "group", "never")
+
+    def __init__(self, path, fsync="group", group_size=64, group_interval=0.01):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Política de fsync inválida: {fsync}")
+
+        self.path = path
+        self.fsync = fsync
+        self.group_size = 1 if fsync == "always" else group_size
+        self.group_interval = group_interval
+        self.pending = []
+        self.pending_since = None
+        self.fsyncs = 0
+        self.file = open(path, "ab", buffering=0)
+
+        # Condition com RLock: protege pending/arquivo e acorda a thread do prazo
+        self._lock = threading.Condition()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_expired, daemon=True)
+        self._flusher.start()
+
+    def _flush_expired(self):
+        """Thread do prazo: grava o grupo pendente quando group_interval vence"""
+        with self._lock:
+            while not self._closed:
+                # Sem grupo pendente, acorda a cada group_interval para conferir; assim
+                # append não precisa notificar a thread (isso custaria uma troca por registro)
+                if self.pending_since is None:
+                    self._lock.wait(self.group_interval)
+                    continue
+
+                remaining = self.pending_since + self.group_interval - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                else:
+                    self.commit()
+
+    def append(self, op, key):
+        """Acrescenta um registro; grava o grupo quando ele fica completo ou velho demais"""
+        payload = RECORD.pack(op, key)
+
+        with self._lock:
+            self.pending.append(payload + CRC.pack(zlib.crc32(payload)))
+
+            if self.pending_since is None:
+                self.pending_since = time.monotonic()
+
+            if len(self.pending) >= self.group_size or time.monotonic() - self.pending_since >= self.group_interval:
+                self.commit()
+
+    def commit(self):
+        """Grava os registros pendentes em uma escrita (e fsync conforme a política)"""
+        with self._lock:
+            if not self.pending:
+                return
+
+            self.file.write(b"".join(self.pending))
+            if self.fsync != "never":
+                os.fsync(self.file.fileno())
+                self.fsyncs += 1
+
+            self.pending = []
+            self.pending_since = None
+
+    def truncate(self):
+        """Descarta o log inteiro (depois de um checkpoint que já contém tudo)"""
+        with self._lock:
+            self.commit()
+            self.file.truncate(0)
+            os.fsync(self.file.fileno())
+            self.fsyncs += 1
+
+    def close(self):
+        """Grava o que está pendente, encerra a thread do prazo e fecha o arquivo"""
+        with self._lock:
+            self.commit()
+            self._closed = True
+            self._lock.notify()
+        self._flusher.join()
+        self.file.close()
+
+    @staticmethod
+    def replay(path):
+        """
+        Gera os registros (operação, chave) do log em ordem. Para no primeiro
+        registro incompleto ou com CRC errado: é a cauda de uma escrita
+        interrompida pela queda, que nunca foi confirmada.
+        """
+        if not os.path.exists(path):
+            return
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            payload = data[offset:offset + RECORD.size]
+            (crc,) = CRC.unpack_from(data, offset + RECORD.size)
+            if zlib.crc32(payload) != crc:
+                return
+            yield RECORD.unpack(payload)
+
+def write_checkpoint(path, keys):
+    """
+    Grava as chaves (já em ordem) de forma atômica: arquivo temporário,
+    fsync e os.replace, então um checkpoint lido é sempre completo. O diretório
+    também recebe fsync, senão a troca de nome pode não sobreviver a uma queda.
+    """
+    keys = list(keys)
+    body = struct.pack(f"!{len(keys)}q", *keys)
+    temporary = path + ".tmp"
+
+    with open(temporary, "wb") as file:
+        file.write(CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, len(keys)))
+        file.write(body)
+        file.write(CRC.pack(zlib.crc32(body)))
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary, path)
+
+    directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
+
+def read_checkpoint(path):
+    """Chaves do checkpoint em ordem (lista vazia se ele não existe)"""
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "rb") as file:
+        data = file.read()
+
+    magic, count = CHECKPOINT_HEADER.unpack_from(data)
+    body = data[CHECKPOINT_HEADER.size:CHECKPOINT_HEADER.size + 8 * count]
+    (crc,) = CRC.unpack_from(data, CHECKPOINT_HEADER.size + 8 * count)
+    if magic != CHECKPOINT_MAGIC or zlib.crc32(body) != crc:
+        raise ValueError(f"Checkpoint corrompido: {path}")
+
+    return list(struct.unpack(f"!{count}q", body))
+
+class DurableIndex:
+    """
+    Árvore (Treap ou AVLTree) de chaves inteiras de 64 bits que sobrevive a quedas
+    - insert/delete vão primeiro para o WAL e depois para a árvore
+    - a cada checkpoint_every operações grava um checkpoint e zera o log
+      (None desliga; checkpoint() pode ser chamado à mão)
+    - ao abrir um diretório existente, recupera o estado: checkpoint + cauda do log
+    Reaplicar um log já contido no checkpoint não muda nada (inserir chave presente
+    e remover chave ausente não fazem nada), então uma queda entre gravar o
+    checkpoint e zerar o log é segura.
+    """
+
+    def __init__(self, directory, structure="AVLTree", fsync="group", group_size=64,
+                 group_interval=0.01, checkpoint_every=100000, **tree_options):
+        if structure not in STRUCTURES:
+            raise ValueError(f"Estrutura inválida: {structure}")
+
+        os.makedirs(directory, exist_ok=True)
+        self.checkpoint_path = os.path.join(directory, "checkpoint")
+        self.log_path = os.path.join(directory, "wal")
+        self.checkpoint_every = checkpoint_every
+        self.operations = 0
+
+        self.tree = STRUCTURES[structure](**tree_options)
+        self.recovered = self._recover()
+        self.log = WriteAheadLog(self.log_path, fsync, group_size, group_interval)
+
+    def _recover(self):
+        """Carrega o checkpoint e reaplica o log; retorna quantos registros foram reaplicados"""
+        for key in read_checkpoint(self.checkpoint_path):
+            self.tree.insert(key)
+
+        replayed = 0
+        for op, key in WriteAheadLog.replay(self.log_path):
+            if op == OP_INSERT:
+                self.tree.insert(key)
+            else:
+                self.tree.delete(key)
+            replayed += 1
+
+        # Uma cauda corrompida é descartada para que novos registros não fiquem depois dela
+        if os.path.exists(self.log_path) and os.path.getsize(self.log_path) != replayed * RECORD_SIZE:
+            with open(self.log_path, "r+b") as file:
+                file.truncate(replayed * RECORD_SIZE)
+
+        return replayed
+
+    def insert(self, key):
+        """Registra e insere uma chave"""
+        self.log.append(OP_INSERT, key)
+        self.tree.insert(key)
+        self._maybe_checkpoint()
+
+    def delete(self, key):
+        """Registra e remove uma chave"""
+        self.log.append(OP_DELETE, key)
+        self.tree.delete(key)
+        self._maybe_checkpoint()
+
+    def search(self, key):
+        """Busca direto na árvore (leituras não vão para o log)"""
+        return self.tree.search(key)
+
+    def _maybe_checkpoint(self):
+        self.operations += 1
+        if self.checkpoint_every is not None and self.operations % self.checkpoint_every == 0:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Grava todas as chaves em ordem e zera o log"""
+        self.log.commit()
+        # write_checkpoint só retorna com o arquivo e a troca de nome já no disco;
+        # só então o log pode ser zerado sem risco de perder operações
+        write_checkpoint(self.checkpoint_path, self.tree.iter_inorder())
+        self.log.truncate()
+
+    def sync(self):
+        """Força o grupo pendente para o disco"""
+        self.log.commit()
+
+    def close(self):
+        """Grava o que está pendente e fecha o log"""
+        self.log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def benchmark_fsync(n=20000, configurations=(("always", 1), ("group", 16), ("group", 256), ("never", 256)),
+                    structure="AVLTree"):
+    """
+    Mede a vazão de escrita (inserções por segundo) para cada política de fsync
+    e tamanho de grupo, e o tempo de recuperação a partir do log resultante
+    """
+    print(f"=== WAL: {n} inserções em {structure} ===")
+    print(f"{'Política':<10} {'Grupo':<8} {'Vazão (ops/s)':<16} {'fsyncs':<10} {'Recuperação (s)':<16}")
+    print("-" * 62)
+
+    for policy, group_size in configurations:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            with DurableIndex(directory, structure, fsync=policy, group_size=group_size,
+                              checkpoint_every=None) as index:
+                for key in range(n):
+                    index.insert(key)
+            elapsed = time.perf_counter() - start
+            fsyncs = index.log.fsyncs
+
+            start = time.perf_counter()
+            DurableIndex(directory, structure, checkpoint_every=None).close()
+            recovery = time.perf_counter() - start
+
+        print(f"{policy:<10} {group_size:<8} {n / elapsed:<16.0f} {fsyncs:<10} {recovery:<16.6f}")
+
+def _bench_policy(policy, group_size):
+    """Factory para o bench.py: n inserções registradas com a política de fsync dada"""
+    def bench(n):
+        def run():
+            with tempfile.TemporaryDirectory() as directory:
+                with DurableIndex(directory, fsync=policy, group_size=group_size, checkpoint_every=None) as index:
+                    for key in range(n):
+                        index.insert(key)
+        return run
+    return bench
+
+# Benchmarks registrados para o bench.py: nome -> (factory(n), tamanhos padrão)
+BENCHMARKS = {
+    "wal/always": (_bench_policy("always", 1), (1000,)),
+    "wal/group16": (_bench_policy("group", 16), (1000, 10000)),
+    "wal/group256": (_bench_policy("group", 256), (1000, 10000)),
+    "wal/never": (_bench_policy("never", 256), (1000, 10000)),
+}
+
+def main():
+    """Função de demonstração do WAL e da recuperação"""
+    print("=== Demonstração do WAL ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Prazo longo para que o último grupo ainda esteja pendente na "queda"
+        index = DurableIndex(directory, checkpoint_every=5, group_interval=60)
+        elements = [10, 5, 15, 3, 7, 12, 18, 1, 4, 6, 8]
+        print("Inserindo elementos:", elements)
+        for elem in elements:
+            index.insert(elem)
+        index.delete(15)
+        # Simula uma queda: o grupo pendente nunca chega ao disco
+        index.sync()
+        index.insert(99)
+        index.log.pending.clear()
+        index.close()
+
+        recovered = DurableIndex(directory)
+        print(f"Recuperado: {recovered.tree.inorder_traversal()} "
+              f"({recovered.recovered} registros reaplicados após o checkpoint)")
+        recovered.close()
+
+    print()
+    benchmark_fsync()
+
+if __name__ == "__main__":
+    main()